@@ -1,5 +1,4 @@
 import json
-import inspect
 import sys
 import os
 from typing import Any, Dict
@@ -155,7 +154,7 @@ class GoogleCloudStorageConnection(BaseBatchConnection):
         """Handles connection and publishing related errors with descriptive messages."""
 
         # Get the name of the calling function to determine the context
-        calling_function = inspect.stack()[1].function
+        calling_function = sys._getframe(1).f_code.co_name
         context = "connecting" if calling_function == "connect" else "publishing"
 
         # Want to highlight additional context if it's passed
@@ -1,7 +1,6 @@
 import json
 import os
 import sys
-import inspect
 from typing import Any, Dict, Optional
 from datetime import datetime, timedelta
 import pytz
@@ -153,7 +152,7 @@ class LocalStorageConnection(BaseBatchConnection):
         """Handles connection and publishing related errors with descriptive messages."""
 
         # Get the name of the calling function to determine the context
-        calling_function = inspect.stack()[1].function
+        calling_function = sys._getframe(1).f_code.co_name
         contexts = {
             'connect' : 'connecting',
             'export' : 'exporting',
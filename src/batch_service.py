@@ -45,7 +45,8 @@ class BatchService:
 
         self.data_generator = DataGenerator(
             self.data_description, 
-            config.datetime_format_string
+            config.datetime_format_string,
+            seed=config.seed
             )
         self.datetime_format_string = config.datetime_format_string
 
@@ -56,10 +57,11 @@ class BatchService:
         self.connect_to = self.connection_details.service
 
         # Validate service type, create event handler and connect
-        if self.connect_to not in self.EVENT_HANDLER_LOOKUP:
+        handler_class = self.EVENT_HANDLER_LOOKUP.get(self.connect_to)
+        if handler_class is None:
             raise ValueError(f"Service '{self.connect_to}' is not supported.")
         
-        self.event_handler = self.EVENT_HANDLER_LOOKUP[self.connect_to](config)
+        self.event_handler = handler_class(config)
         self.event_handler.connect()
         # Generate and upload the first batch
         data = self.generate()
@@ -68,9 +70,10 @@ class BatchService:
 
     def generate(self) -> List:
         """
-        Generates a chunk of data
+        Generates a chunk of data. The records are reused by the next call, which 
+        is safe as each chunk is exported before the next is generated.
         """
-        return self.data_generator.generate(num_records=self.block_size)
+        return self.data_generator.generate(num_records=self.block_size, reuse_records=True)
         
 
     def export_batch(self, data: List) -> None:
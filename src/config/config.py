@@ -1,9 +1,8 @@
 import os
-import json
 from typing import List, Optional, Literal, Any, Union
 from typing_extensions import Annotated
 
-from pydantic import BaseModel, Field, model_validator, field_validator, RootModel
+from pydantic import BaseModel, ConfigDict, Field, model_validator, field_validator, RootModel
 
 
 # TODO: # Add these later
@@ -58,6 +57,10 @@ class FloatField(BaseDataField):
                                         description="Min and max values defining the range of allowable values in the colums",
                                         min_items=2, 
                                         max_items=2)
+    decimal_places: Optional[int] = Field(default=None,
+                                          description="Round generated values to this many decimal places, to shorten the output",
+                                          ge=0,
+                                          le=15)
     
     validate_fields = field_validator("allowable_values")(validate_values_different)
         
@@ -133,6 +136,25 @@ class StreamingConnectionCredsPubSub(BaseModel):
     project_id: str = Field(...)
     topic_id: str = Field(...)
     credentials_path: str = Field(...)
+    # Publisher batching. A batch is sent as soon as any one of these is reached
+    max_messages: int = Field(default=1000,
+                              description="Maximum number of messages in a single publish request",
+                              gt=0,
+                              le=1000)
+    max_bytes: int = Field(default=1_000_000,
+                           description="Maximum size in bytes of a single publish request",
+                           gt=0,
+                           le=10_000_000)
+    max_latency: float = Field(default=0.05,
+                               description="Maximum time in seconds to wait before sending a batch",
+                               ge=0)
+    max_outstanding_messages: int = Field(default=10_000,
+                                          description="Publishing blocks once this many messages are waiting to be sent",
+                                          gt=0)
+    compression: bool = Field(default=True,
+                              description="Gzip compress publish requests on the gRPC channel")
+    message_format: Literal['json', 'protobuf'] = Field(default='json',
+                                                        description="Wire format of published messages")
 
 
 class StreamingConfig(BaseModel):
@@ -144,6 +166,7 @@ class StreamingConfig(BaseModel):
         interval (int): The interval in seconds between each data streaming event.
         size (int): The number of records to generate per streaming interval.
         randomise (bool): Indicates whether the data generated should be randomized.
+        seed (Optional[int]): Seed for generating the same data on every run. Random if not set.
         connection (Dict[str, Union[str, int]]): The connection details for the streaming service.
             Expected keys may include:
                 - 'service' (str): The name of the streaming service (e.g., 'pubsub').
@@ -160,6 +183,7 @@ class StreamingConfig(BaseModel):
     interval: int = 60 # Every minute
     size: int = 3 # rows
     randomise: bool = False
+    seed: Optional[int] = None
     datetime_format_string: str = '%Y%m%d %H%M%S %f %z'
     connection: Union[
         StreamingConnectionCredsPubSub
@@ -176,6 +200,7 @@ class BatchConfig(BaseModel):
         interval (int): The interval in seconds between each batch file export.
         size (int): The number of records to include in each batch export.
         randomise (bool): Indicates whether the data in each batch should be randomized.
+        seed (Optional[int]): Seed for generating the same data on every run. Random if not set.
         filetype (str): The file format for batch export (e.g., 'csv', 'json').
         cleanup_after (int): The time in minutes after which the batch file is deleted.
         connection (Dict[str, Union[str, int]]): The connection details for the batch export service.
@@ -202,6 +227,7 @@ class BatchConfig(BaseModel):
     size: int = 1000 # Rows
     cleanup_after: Union[int, None] = 60*60*24*7 # Weekly
     randomise: bool = False
+    seed: Optional[int] = None
     datetime_format_string: str = '%Y%m%d %H%M%S %f %z'
     connection: Union[
         BatchLocalCreds,
@@ -214,9 +240,16 @@ class Config(BaseModel):
     """
     Main configuration class for FakeOut, handling multiple streaming and batch configurations.
     """
+    # Config files name the lists "streaming" and "batch"
+    model_config = ConfigDict(populate_by_name=True)
+
     version: str = Field()
-    streaming_configs: List[StreamingConfig] = Field(max_items=5)
-    batch_configs: List[BatchConfig] = Field(max_items=5)
+    streaming_configs: List[StreamingConfig] = Field(
+        default_factory=list, max_items=5, validation_alias='streaming'
+        )
+    batch_configs: List[BatchConfig] = Field(
+        default_factory=list, max_items=5, validation_alias='batch'
+        )
 
     @classmethod
     def from_dict(cls, config_data: dict) -> "Config":
@@ -246,7 +279,15 @@ class Config(BaseModel):
         Class method to create an instance from a JSON file.
         """
         config_file_path = os.path.join(os.path.dirname(__file__), '..', '..', file_path)
-        with open(config_file_path, 'r') as file:
-            config_data = json.load(file)
-    
-        return cls.from_dict(config_data)
\ No newline at end of file
+        with open(config_file_path, 'rb') as file:
+            return cls.from_json_bytes(file.read())
+
+    @classmethod
+    def from_json_bytes(cls, json_data: bytes) -> "Config":
+        """
+        Class method to create an instance from the contents of a JSON config file.
+
+        The JSON is parsed and validated in a single pass by pydantic, without 
+        building an intermediate dict. Invalid JSON raises a ValidationError.
+        """
+        return cls.model_validate_json(json_data)
\ No newline at end of file
@@ -1,11 +1,81 @@
-from random import choice, uniform, randint
-from datetime import datetime, timedelta
-import random
+import logging
+from datetime import datetime
+from functools import lru_cache
+import numpy as np
 import pytz
-from typing import List, Dict, Any, Iterator, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 from config import Config
 
+logger = logging.getLogger(__name__)
+
+
+# Formatting numpy datetimes as strings is slow, so generated dates are looked 
+#  up in tables of preformatted strings unless the range is wider than this
+MAX_DATE_TABLE_DAYS = 100_000
+
+
+@lru_cache(maxsize=None)
+def _date_strings(start_date: np.datetime64, n_days: int) -> np.ndarray:
+    """Returns "%Y-%m-%d" strings for `n_days` consecutive days from `start_date`."""
+    days = start_date + np.arange(n_days)
+    return np.datetime_as_string(days, unit="D").astype(object)
+
+
+@lru_cache(maxsize=1)
+def _time_of_day_strings() -> np.ndarray:
+    """Returns " %H:%M:%S" strings for every second of the day."""
+    return np.array(
+        [f" {h:02d}:{m:02d}:{s:02d}" for h in range(24) for m in range(60) for s in range(60)],
+        dtype=object
+        )
+
+
+@lru_cache(maxsize=None)
+def _allowable_array(allowable_values: Tuple, dtype: Any) -> np.ndarray:
+    """
+    Converts a field's allowable values to a numpy array once per distinct set 
+    of values, rather than on every generated block. Must not be modified.
+    """
+    return np.array(allowable_values, dtype=dtype)
+
+
+@lru_cache(maxsize=None)
+def _date_range(allowable_values: Tuple[str, str]) -> Tuple[np.datetime64, int]:
+    """
+    Parses a "%Y-%m-%d" range once into its start date and number of days.
+    Parsed with strptime, which is stricter than numpy about the format but 
+    accepts days and months without leading zeros.
+    """
+    start_date, end_date = (
+        np.datetime64(datetime.strptime(value, "%Y-%m-%d").date(), "D") for value in allowable_values
+        )
+    return start_date, int((end_date - start_date).astype(np.int64)) + 1
+
+
+@lru_cache(maxsize=None)
+def _datetime_range(allowable_values: Tuple[str, str]) -> Tuple[np.datetime64, int, np.datetime64, int, int]:
+    """
+    Parses a "%Y-%m-%d %H:%M:%S" range once into integers for sampling, with 
+    strptime as for `_date_range`.
+
+    Returns:
+        Tuple: The start datetime, the length of the range in seconds, the day 
+        the range starts on, the number of days it covers and the second of 
+        the day that it starts on.
+    """
+    start_datetime, end_datetime = (
+        np.datetime64(datetime.strptime(value, "%Y-%m-%d %H:%M:%S"), "s") for value in allowable_values
+        )
+    start_day = start_datetime.astype("datetime64[D]")
+    return (
+        start_datetime,
+        int((end_datetime - start_datetime).astype(np.int64)),
+        start_day,
+        int((end_datetime.astype("datetime64[D]") - start_day).astype(np.int64)) + 1,
+        int((start_datetime - start_day).astype(np.int64)),
+        )
+
 
 
 class DataGenerator:
@@ -16,19 +86,30 @@ class DataGenerator:
         datetime_format_string (str): Format string for the datetime field in generated data.
         data_description (List[Dict[str, Any]]): Describes the data fields to be generated.
         keep_on_swimming (bool): Flag to indicate whether data generation should continue.
+        rng (np.random.Generator): Random number generator used for every field.
         datatype_lookup (Dict[str, Callable]): Mapping of data types to generation methods.
+        column_lookup (Dict[str, Callable]): Mapping of data types to methods that 
+            generate a whole column of values at once.
     """
     
-    def __init__(self, data_description: Dict, datetime_format_string: str) -> None:
+    def __init__(self, data_description: Dict, datetime_format_string: str, 
+                 seed: Optional[int] = None) -> None:
         """
         Initializes the DataGenerator with configuration settings.
 
         Args:
             config (Config): Configuration object containing settings for data generation.
+            seed (Optional[int]): Seed for the random number generator, to generate 
+                the same data on every run. Drawn from the OS if None.
         """
         self.data_description = data_description
         self.datetime_format_string = datetime_format_string
         self.keep_on_swimming = True
+        # Each generator has its own random state, rather than sharing the 
+        #  global state of the random module with other services
+        self.rng = np.random.default_rng(seed)
+        # Records overwritten in place by generate(reuse_records=True)
+        self._record_pool = []
 
         # Add new data types and their associated methods here
         #  Don't for get to update src\tests\data_fields.py to include them 
@@ -41,23 +122,119 @@ class DataGenerator:
             'date': self._generate_date_data,
             'datetime': self._generate_datetime_data
         }
+        self.column_lookup = {
+            'category': self._generate_categorical_column,
+            'float': self._generate_float_column,
+            'integer': self._generate_integer_column,
+            'bool': self._generate_boolean_column,
+            'date': self._generate_date_column,
+            'datetime': self._generate_datetime_column
+        }
+        # Each field's generating methods are looked up once here, rather than 
+        #  for every record or block
+        self._field_plan = [
+            (datapoint, self.datatype_lookup[datapoint.data_type], self.column_lookup[datapoint.data_type])
+            for datapoint in self.data_description
+        ]
+
+    def generate(self, num_records: Optional[int] = 1, reuse_records: bool = False
+                 ) -> List[Dict[str, Any]]:
+        """
+        Generates a block of synthetic data records.
+
+        A fixed number of records is generated a column at a time by 
+        `generate_columns`, then zipped into rows. If `num_records` is None, 
+        records are generated one at a time until stopped.
+
+        Args:
+            num_records (Optional[int]): Number of records to generate, or None 
+                to keep generating until `stop` is called.
+            reuse_records (bool): Overwrite the list and records returned by the 
+                previous call, rather than allocating new ones. Only safe if the 
+                previous block has been consumed, e.g. exported synchronously.
 
-    def generate(self, num_records: Optional[int] = 1) -> Iterator[Dict[str, Any]]:
+        Returns:
+            List[Dict[str, Any]]: Data records with a timestamp and fields based 
+            on the data description in the configuration.
         """
-        Continuously generates synthetic data until stopped.
+        if num_records is None:
+            return self._generate_until_stopped()
+        if not self.keep_on_swimming:
+            return []
 
-        Yields:
-            Dict[str, Any]: A dictionary containing a data record with a timestamp 
-            and fields based on the data description in the configuration.
+        columns = self.generate_columns(num_records)
+        if reuse_records:
+            return self._fill_record_pool(columns)
+        return self._fill_records(self._new_records(columns), columns)
+
+    def generate_columns(self, num_records: int) -> Dict[str, List[Any]]:
+        """
+        Generates a block of synthetic data with one list of values per field.
+
+        Each field is drawn in a single vectorised call rather than once per 
+        record, and converted back to native Python types so it can be 
+        serialised directly.
+
+        Args:
+            num_records (int): Number of values to generate for each field.
+
+        Returns:
+            Dict[str, List[Any]]: The `generated_at` timestamp and each field 
+            in the data description, mapped to a list of `num_records` values.
         """
-        records = []
-        count = 0
         generated_at = datetime.now(pytz.utc).strftime(self.datetime_format_string)
+        columns = {"generated_at": [generated_at] * num_records}
+        for datapoint, _, generating_fn in self._field_plan:
+            try:
+                if datapoint.proportion_nulls >= 1:
+                    # Every value would be replaced, so there's nothing to draw
+                    columns[datapoint.name] = [None] * num_records
+                    continue
+                values = generating_fn(datapoint, num_records)
+                self._apply_nulls(values, datapoint.proportion_nulls)
+                columns[datapoint.name] = values
+            except Exception:
+                logger.exception("Error generating data for %s: %r", datapoint.name, datapoint)
+                continue  # Skip this data point
+
+        return columns
+
+    def _fill_record_pool(self, columns: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+        """
+        Writes a block of columns into the pooled records, rebuilding the pool if 
+        the number of records or the fields have changed.
+        """
+        pool = self._record_pool
+        if len(pool) != len(columns["generated_at"]) or (pool and list(pool[0]) != list(columns)):
+            pool = self._record_pool = self._new_records(columns)
+        return self._fill_records(pool, columns)
+
+    @staticmethod
+    def _new_records(columns: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+        """
+        Creates a record for each row of the columns, with every key set to None.
 
-        while self.keep_on_swimming and (num_records is None or count < num_records):
-            new_row = self._generate_fake_data(generated_at)
-            records.append(new_row)
-            count += 1
+        Copying a template copies its hash table in one go, rather than inserting 
+        each key into every new record.
+        """
+        template = dict.fromkeys(columns)
+        return [template.copy() for _ in range(len(columns["generated_at"]))]
+
+    @staticmethod
+    def _fill_records(records: List[Dict[str, Any]], columns: Dict[str, List[Any]]
+                      ) -> List[Dict[str, Any]]:
+        """Writes a block of columns into existing records, a column at a time."""
+        for key, values in columns.items():
+            for record, value in zip(records, values):
+                record[key] = value
+        return records
+
+    def _generate_until_stopped(self) -> List[Dict[str, Any]]:
+        """Generates records one at a time until `stop` is called."""
+        records = []
+        generated_at = datetime.now(pytz.utc).strftime(self.datetime_format_string)
+        while self.keep_on_swimming:
+            records.append(self._generate_fake_data(generated_at))
         return records
 
     def stop(self) -> None:
@@ -75,20 +252,84 @@ class DataGenerator:
             Dict[str, Any]: A dictionary containing generated data fields and a timestamp.
         """
         base_data = {"generated_at" : timestamp}
-        for datapoint in self.data_description:
+        for datapoint, generating_fn, _ in self._field_plan:
             try:
-                data_type = datapoint.data_type
-                generating_fn = self.datatype_lookup[data_type]
                 output = generating_fn(datapoint)
                 base_data.update(output)
-            except Exception as e:
-                print(datapoint)
-                print(f"Error generating data for {datapoint.name}: {e}")
+            except Exception:
+                logger.exception("Error generating data for %s: %r", datapoint.name, datapoint)
                 continue  # Skip this data poin
 
         return base_data
     
     
+    def _apply_nulls(self, values: List[Any], proportion_nulls: float) -> None:
+        """Replaces a random `proportion_nulls` share of the values with None, in place."""
+        if proportion_nulls <= 0:
+            return
+        null_mask = self.rng.random(len(values)) < proportion_nulls
+        for i in np.flatnonzero(null_mask).tolist():
+            values[i] = None
+
+
+    def _generate_categorical_column(self, field_config: Dict, n: int) -> List[str]:
+        """Draws `n` values uniformly from the allowable categories."""
+        # An object array, so the configured strings are reused rather than 
+        #  copied into a numpy string array and rebuilt for every value
+        categories = _allowable_array(tuple(field_config.allowable_values), object)
+        # Indexing with drawn positions skips the argument checks in Generator.choice
+        return categories[self.rng.integers(0, len(categories), size=n)].tolist()
+
+
+    def _generate_float_column(self, field_config: Dict, n: int) -> List[float]:
+        """Draws `n` floats uniformly from the allowable range, rounded if configured."""
+        low, high = field_config.allowable_values
+        values = self.rng.uniform(low, high, size=n)
+        if field_config.decimal_places is not None:
+            values = np.round(values, field_config.decimal_places)
+        return values.tolist()
+
+
+    def _generate_integer_column(self, field_config: Dict, n: int) -> List[int]:
+        """Draws `n` integers uniformly from the allowable range, inclusive of both ends."""
+        low, high = field_config.allowable_values
+        return self.rng.integers(low, high, size=n, endpoint=True, dtype=np.int64).tolist()
+
+
+    def _generate_boolean_column(self, field_config: Dict, n: int) -> List[bool]:
+        """Draws `n` booleans with equal probability."""
+        return (self.rng.random(n) < 0.5).tolist()
+
+
+    def _generate_date_column(self, field_config: Dict, n: int) -> List[str]:
+        """Draws `n` "%Y-%m-%d" date strings uniformly from the allowable range."""
+        start_date, n_days = _date_range(tuple(field_config.allowable_values))
+        offsets = self.rng.integers(0, n_days, size=n)
+
+        if n_days > MAX_DATE_TABLE_DAYS:
+            return np.datetime_as_string(start_date + offsets, unit="D").tolist()
+        return _date_strings(start_date, n_days)[offsets].tolist()
+
+
+    def _generate_datetime_column(self, field_config: Dict, n: int) -> List[str]:
+        """Draws `n` "%Y-%m-%d %H:%M:%S" datetime strings uniformly from the allowable range."""
+        start_datetime, span, start_day, n_days, start_second = _datetime_range(
+            tuple(field_config.allowable_values)
+            )
+        offsets = self.rng.integers(0, span, size=n, endpoint=True)
+
+        if n_days > MAX_DATE_TABLE_DAYS:
+            # numpy separates the date and time with a "T"
+            values = np.datetime_as_string(start_datetime + offsets, unit="s")
+            return np.char.replace(values, "T", " ").tolist()
+
+        # Split each datetime into its day and second of the day to look up both parts
+        days, seconds = np.divmod(offsets + start_second, 86400)
+        # Object arrays, so the strings are joined without numpy's fixed width copies
+        values = _date_strings(start_day, n_days)[days] + _time_of_day_strings()[seconds]
+        return values.tolist()
+
+
     def _generate_categorical_data(self, field_config: Dict) -> Dict:
         """
         Generates a categorical data field with the option to return None based on proportion_nulls.
@@ -99,9 +340,10 @@ class DataGenerator:
         Returns:
             Dict[str, Union[str, None]]: A dictionary containing the generated categorical data or None.
         """
-        if random.random() < field_config.proportion_nulls:
+        if self.rng.random() < field_config.proportion_nulls:
             return {field_config.name: None}
-        return {field_config.name: random.choice(field_config.allowable_values)}
+        allowable_values = field_config.allowable_values
+        return {field_config.name: allowable_values[self.rng.integers(len(allowable_values))]}
     
 
     def _generate_float_data(self, field_config: Dict) -> Dict:
@@ -114,10 +356,13 @@ class DataGenerator:
         Returns:
             Dict: A dictionary containing the generated numeric data or None.
         """
-        if random.random() < field_config.proportion_nulls:
+        if self.rng.random() < field_config.proportion_nulls:
             return {field_config.name: None}
         data_range = field_config.allowable_values
-        return {field_config.name: random.uniform(data_range[0], data_range[1])}
+        value = float(self.rng.uniform(data_range[0], data_range[1]))
+        if field_config.decimal_places is not None:
+            value = round(value, field_config.decimal_places)
+        return {field_config.name: value}
     
     
     def _generate_integer_data(self, field_config: Dict) -> Dict:
@@ -130,10 +375,12 @@ class DataGenerator:
         Returns:
             Dict[str, Union[int, None]]: A dictionary containing the generated integer data or None.
         """
-        if random.random() < field_config.proportion_nulls:
+        if self.rng.random() < field_config.proportion_nulls:
             return {field_config.name: None}
-        data_range = field_config.allowable_values
-        return {field_config.name: random.randint(data_range[0], data_range[1])}
+        low, high = field_config.allowable_values
+        # Generator.integers draws bounded ints without randint's rejection loop
+        value = self.rng.integers(low, high, endpoint=True, dtype=np.int64)
+        return {field_config.name: int(value)}
     
 
     def _generate_boolean_data(self, field_config: Dict) -> Dict:
@@ -146,9 +393,9 @@ class DataGenerator:
         Returns:
             Dict[str, Union[bool, None]]: A dictionary containing the generated boolean data or None.
         """
-        if random.random() < field_config.proportion_nulls:
+        if self.rng.random() < field_config.proportion_nulls:
             return {field_config.name: None}
-        return {field_config.name: random.choice([True, False])}
+        return {field_config.name: bool(self.rng.random() < 0.5)}
     
     
     def _generate_date_data(self, field_config: Dict) -> Dict:
@@ -161,14 +408,16 @@ class DataGenerator:
         Returns:
             Dict[str, Union[str, None]]: A dictionary containing the generated date data or None.
         """
-        if random.random() < field_config.proportion_nulls:
+        if self.rng.random() < field_config.proportion_nulls:
             return {field_config.name: None}
         
         #TODO add in more date type checking to support different formats
-        start_date = datetime.strptime(field_config.allowable_values[0], "%Y-%m-%d")
-        end_date = datetime.strptime(field_config.allowable_values[1], "%Y-%m-%d")
-        random_date = start_date + timedelta(days=random.randint(0, (end_date - start_date).days))
-        return {field_config.name: random_date.strftime("%Y-%m-%d")}
+        # Integer day arithmetic on the parsed range, rather than strptime per record
+        start_date, n_days = _date_range(tuple(field_config.allowable_values))
+        offset = int(self.rng.integers(n_days))
+        if n_days > MAX_DATE_TABLE_DAYS:
+            return {field_config.name: str(start_date + offset)}
+        return {field_config.name: _date_strings(start_date, n_days)[offset]}
     
     
     def _generate_datetime_data(self, field_config: Dict) -> Dict:
@@ -181,11 +430,15 @@ class DataGenerator:
         Returns:
             Dict[str, Union[str, None]]: A dictionary containing the generated datetime data or None.
         """
-        if random.random() < field_config.proportion_nulls:
+        if self.rng.random() < field_config.proportion_nulls:
             return {field_config.name: None}
         #TODO add in more date type checking to support different formats. 
-        #  Consider pulling into a different function to support _generate_date_data
-        start_datetime = datetime.strptime(field_config.allowable_values[0], "%Y-%m-%d %H:%M:%S")
-        end_datetime = datetime.strptime(field_config.allowable_values[1], "%Y-%m-%d %H:%M:%S")
-        random_datetime = start_datetime + timedelta(seconds=random.randint(0, int((end_datetime - start_datetime).total_seconds())))
-        return {field_config.name: random_datetime.strftime("%Y-%m-%d %H:%M:%S")}
+        # Integer second arithmetic on the parsed range, rather than strptime per record
+        start_datetime, span, start_day, n_days, start_second = _datetime_range(
+            tuple(field_config.allowable_values)
+            )
+        offset = int(self.rng.integers(0, span, endpoint=True))
+        if n_days > MAX_DATE_TABLE_DAYS:
+            return {field_config.name: str(start_datetime + offset).replace("T", " ")}
+        day, second = divmod(offset + start_second, 86400)
+        return {field_config.name: _date_strings(start_day, n_days)[day] + _time_of_day_strings()[second]}
@@ -1,4 +1,5 @@
 import os
+import logging
 import signal
 import sys
 import argparse
@@ -19,8 +20,16 @@ if __name__ == "__main__":
     # Setup argument parser for command line running. 
     parser = argparse.ArgumentParser(description="Run the data generator application.")
     parser.add_argument("--config", type=str, required=True, help="Path to the configuration file.")
+    parser.add_argument("--log-level", type=str, default="INFO", 
+                        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+                        help="Logging level. Use WARNING to hide a log line per published message.")
     args = parser.parse_args()  # Parse command-line arguments
 
+    logging.basicConfig(
+        level=args.log_level, 
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+        )
+
 
     # Setup signal handling for graceful shutdown
     signal.signal(signal.SIGINT, signal_handler)
@@ -32,5 +41,5 @@ if __name__ == "__main__":
     # Create the Worker with all services
     worker = Worker(config)
 
-    # Start the worker threads
-    worker.start()  # This should start both the streaming and batch processes
\ No newline at end of file
+    # Start a process for each streaming and batch service
+    worker.start()
\ No newline at end of file
@@ -1 +1,7 @@
-from .pubsub_handler import PubSubEventHandler
\ No newline at end of file
+def __getattr__(name):
+    # Handlers are imported on first access, so importing the package doesn't
+    #  load every handler's client library
+    if name == "PubSubEventHandler":
+        from .pubsub_handler import PubSubEventHandler
+        return PubSubEventHandler
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -12,6 +12,7 @@ class BaseEventHandler(ABC):
     Attributes:
         connection_creds: Credentials required for connecting to the external service, 
                           typically provided in the configuration.
+        n_confirmed (int): Number of messages the external service has confirmed receiving.
     """
 
     def __init__(self) -> None:
@@ -22,7 +23,7 @@ class BaseEventHandler(ABC):
             config (dict): Configuration dictionary containing credentials and other settings 
                            needed for connecting to the target service.
         """
-        pass
+        self.n_confirmed = 0
 
     @abstractmethod
     def connect(self):
@@ -43,4 +44,35 @@ class BaseEventHandler(ABC):
         """
         pass
 
+    @abstractmethod
+    def publish_async(self, message):
+        """
+        Publishes a message without waiting for it to be delivered.
+        
+        Args:
+            message (dict or str): The data/message to be published, format determined by subclasses.
 
+        Returns:
+            concurrent.futures.Future: Resolves once the message has been delivered.
+        """
+        pass
+
+    @abstractmethod
+    def publish_batch(self, messages):
+        """
+        Publishes each of a list of messages without waiting for them to be delivered.
+        `n_confirmed` is incremented as each delivery is confirmed.
+        
+        Args:
+            messages (list): The data/messages to be published, one message each.
+        """
+        pass
+
+    @abstractmethod
+    def close(self):
+        """
+        Flushes any pending messages and closes the connection to the external service.
+        
+        To be implemented by subclasses for their respective services.
+        """
+        pass
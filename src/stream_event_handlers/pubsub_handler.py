@@ -1,10 +1,17 @@
 import json
+import logging
 import os
 import sys
-import inspect
-from typing import Any, Dict
+import threading
+from collections import deque
+from concurrent import futures
+from functools import partial
+from typing import Any, Dict, List, Tuple
 
+import grpc
 from google.cloud import pubsub_v1
+from google.pubsub_v1.services.publisher.transports import PublisherGrpcTransport
+from google.protobuf import struct_pb2
 from google.oauth2 import service_account
 from google.auth.exceptions import DefaultCredentialsError, GoogleAuthError
 from google.api_core.exceptions import (
@@ -15,10 +22,33 @@ from google.api_core.exceptions import (
     PermissionDenied
     )
 
+try:
+    import orjson
+except ImportError:  # Optional. Falls back to the standard library json encoder
+    orjson = None
+
 from .base import BaseEventHandler
 from config import Config
 
 
+logger = logging.getLogger(__name__)
+
+# Parsed service account credentials. Maps (path, modified time) => Credentials
+_CREDENTIALS_CACHE: Dict[Tuple[str, int], service_account.Credentials] = {}
+
+
+def _load_credentials(creds_path: str) -> service_account.Credentials:
+    """
+    Loads service account credentials, parsing each version of the file only once.
+    Raises FileNotFoundError if the file doesn't exist.
+    """
+    key = (creds_path, os.stat(creds_path).st_mtime_ns)
+    credentials = _CREDENTIALS_CACHE.get(key)
+    if credentials is None:
+        credentials = service_account.Credentials.from_service_account_file(creds_path)
+        _CREDENTIALS_CACHE[key] = credentials
+    return credentials
+
 
 class PubSubEventHandler(BaseEventHandler):
     """
@@ -33,15 +63,93 @@ class PubSubEventHandler(BaseEventHandler):
         project_id (str): Google Cloud project ID where the Pub/Sub topic resides.
         topic_id (str): ID of the Pub/Sub topic to publish messages to.
         credentials_path (str): Path to the JSON file with Google Cloud service account credentials.
-        publisher (pubsub_v1.PublisherClient): Client instance for publishing messages to Pub/Sub.
+        batch_settings (pubsub_v1.types.BatchSettings): How the client groups messages into requests.
+        flow_control (pubsub_v1.types.PublishFlowControl): Limits messages waiting to be sent.
+        compression (bool): Whether publish requests are gzip compressed.
+        message_format (str): Wire format of the published messages, 'json' or 'protobuf'.
+        client (pubsub_v1.PublisherClient): Client instance for publishing messages to Pub/Sub.
         topic_path (str): Fully qualified path of the Pub/Sub topic.
 
     Methods:
         connect():
             Establishes a connection to the Pub/Sub service by initializing the Publisher client.
         publish(data):
-            Publishes a message to the configured Pub/Sub topic.
+            Publishes a message to the configured Pub/Sub topic without waiting for it to be sent.
+        publish_async(data):
+            Publishes a message and returns the future for it.
+        publish_batch(records):
+            Publishes each record as its own message without waiting for them to be sent.
+        close():
+            Waits for any messages still in flight and stops the Publisher client.
     """
+
+    # Error message templates, filled in by _handle_errors
+    _TMPL_NOT_FOUND = (
+        "Error during {ctx} for streaming service: {name}: "
+        "The topic '{topic}' does not exist in project "
+        "'{project}'. Please verify that the topic is created "
+        "and the project ID is correct.{extra}"
+    )
+    _TMPL_FORBIDDEN = (
+        "Error during {ctx} for streaming service: {name}: "
+        "Permission denied when accessing the topic.\nEnsure the "
+        "service account has the required Pub/Sub permissions for "
+        "{topic} in {project}.{extra}"
+    )
+    _TMPL_SERVICE_UNAVAILABLE = (
+        "Error during {ctx} for streaming service: {name}: "
+        "Pub/Sub service is unavailable. Please try again later."
+        "{extra}"
+    )
+    _TMPL_DEFAULT_CREDENTIALS = (
+        "Error during {ctx} for streaming service: {name}: "
+        "Invalid credentials  for {topic} in {project}. "
+        "Please check your service account credentials."
+        "{extra}"
+    )
+    _TMPL_GOOGLE_API = (
+        "Google API error during {ctx} for streaming service: "
+        "{name}: {exception}. Please check your Google Cloud "
+        "configurations and network access.{extra}"
+    )
+    _TMPL_FILE_NOT_FOUND = (
+        "Error during {ctx} for streaming service: {name}: "
+        "The credentials file was not found.\nPlease check that you "
+        "put your Google credentials in the _creds folder, and that "
+        "the filename is correct.{extra}"
+    )
+    _TMPL_GOOGLE_AUTH = (
+        "Error during {ctx} for streaming service: {name}: "
+        "Google authentication error.\nExiting the application. "
+        "Please check your credentials and permissions  for "
+        "{topic} in {project}.{extra}"
+    )
+    _TMPL_PERMISSION_DENIED = (
+        "Error: Permission denied while {ctx} to streaming service: "
+        "{name}.\nThis likely indicates insufficient permissions "
+        "for {topic} in {project}.{extra}"
+    )
+    _TMPL_GENERIC = (
+        "Unexpected error during {ctx} for streaming service: "
+        "{name}: {exception}. Please review your configuration "
+        "and credentials.{extra}"
+    )
+
+    # Message template for each handled error type, used by _handle_errors
+    _ERROR_TEMPLATES = {
+        NotFound: _TMPL_NOT_FOUND,
+        Forbidden: _TMPL_FORBIDDEN,
+        ServiceUnavailable: _TMPL_SERVICE_UNAVAILABLE,
+        DefaultCredentialsError: _TMPL_DEFAULT_CREDENTIALS,
+        GoogleAPIError: _TMPL_GOOGLE_API,
+        FileNotFoundError: _TMPL_FILE_NOT_FOUND,
+        GoogleAuthError: _TMPL_GOOGLE_AUTH,
+        PermissionDenied: _TMPL_PERMISSION_DENIED,
+    }
+
+    # Errors that publishing again won't fix, such as a missing topic or IAM role
+    NON_RETRYABLE_ERRORS = (NotFound, Forbidden)
+
     ALL_POSSIBLE_ERRORS = (
             FileNotFoundError, 
             DefaultCredentialsError, 
@@ -50,7 +158,6 @@ class PubSubEventHandler(BaseEventHandler):
             NotFound, 
             Forbidden, 
             GoogleAPIError, 
-            Exception,
             PermissionDenied
             )
 
@@ -66,25 +173,63 @@ class PubSubEventHandler(BaseEventHandler):
         self.project_id = config.connection.project_id
         self.topic_id = config.connection.topic_id
         self.credentials_path = config.connection.credentials_path
-        self.publisher = None
+        self.batch_settings = pubsub_v1.types.BatchSettings(
+            max_messages=config.connection.max_messages,
+            max_bytes=config.connection.max_bytes,
+            max_latency=config.connection.max_latency,
+            )
+        # Lets many publishes overlap, while blocking the caller rather than 
+        #  buffering without limit if the network can't keep up
+        self.flow_control = pubsub_v1.types.PublishFlowControl(
+            message_limit=config.connection.max_outstanding_messages,
+            limit_exceeded_behavior=pubsub_v1.types.LimitExceededBehavior.BLOCK,
+            )
+        self.compression = config.connection.compression
+        self.client = None
         self.topic_path = None
+        # Fixed values for the error message templates
+        self._fmt_ctx = {"name": self.name, "topic": self.topic_id, "project": self.project_id}
+        self._inflight = deque()
+        self._publish = None
+        # Publish callbacks run on the client's threads, so guard the counter
+        self._confirmed_lock = threading.Lock()
+        # First non-retryable publish error, raised by the next publish_batch or close
+        self._fatal_error = None
+
+        # Compact separators keep the payload small. Bound once as it's on the hot path
+        self._json_encode = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+        self.message_format = config.connection.message_format
+        if self.message_format == 'protobuf':
+            self._encode = self._encode_protobuf
+        elif orjson is not None:
+            # Already compact UTF-8 bytes, with no intermediate str
+            self._encode = orjson.dumps
+        else:
+            self._encode = self._encode_json
               
 
     def connect(self) -> None:
         """Attempts to connect to Google Pub/Sub, handling common connection errors."""
         creds_path = os.path.join("_creds", self.credentials_path)
-
         try:
-            # Load credentials from specified path
-            if not os.path.exists(creds_path):
-                raise FileNotFoundError(f"Credentials file not found at {creds_path}")
-
-            # Initialize Pub/Sub client with credentials
-            credentials = service_account.Credentials.from_service_account_file(creds_path)
-            self.client = pubsub_v1.PublisherClient(credentials=credentials)
+            # Load credentials from specified path. Raises FileNotFoundError if missing
+            credentials = _load_credentials(creds_path)
+            if self.compression:
+                # Records are repetitive JSON, so compress well on the wire
+                channel = partial(PublisherGrpcTransport.create_channel, 
+                                  compression=grpc.Compression.Gzip)
+            else:
+                channel = None
+            transport = PublisherGrpcTransport(credentials=credentials, channel=channel)
+            self.client = pubsub_v1.PublisherClient(
+                batch_settings=self.batch_settings,
+                publisher_options=pubsub_v1.types.PublisherOptions(flow_control=self.flow_control),
+                transport=transport
+                )
 
             # Need to create the string topic path before we can check if it exists
             self.topic_path = self.client.topic_path(self.project_id, self.topic_id)
+            self._publish = self.client.publish
 
         except self.ALL_POSSIBLE_ERRORS as e:
             self._handle_errors(e)
@@ -95,91 +240,149 @@ class PubSubEventHandler(BaseEventHandler):
         """
         Publishes a message to the Pub/Sub topic.
 
+        Doesn't wait for the message to be sent, so that the client can batch 
+        messages together. Transient errors are retried by the client on the 
+        same channel, and anything that still fails is reported by 
+        `_on_publish_done`, so the connection survives failed publishes. The 
+        client's flow control blocks the caller once `max_outstanding_messages` 
+        are waiting to be sent.
+
         Args:
-            data (dict): The data to be published, converted to JSON.
+            data (dict): The data to be published, converted to JSON or protobuf.
         """
-        try:
-            data = json.dumps(data).encode("utf-8")
-            future = self.client.publish(self.topic_path, data)
-            print(f"Published Pub/Sub message ID: {future.result()} to "
-                  f"{self.topic_path} in {self.project_id}")
+        self._inflight.append(self.publish_async(data))
+        self._prune_inflight()
 
-        except self.ALL_POSSIBLE_ERRORS as e:
-            self._handle_errors(e)
-            sys.exit(1)
+
+    def publish_async(self, data) -> futures.Future:
+        """
+        Publishes a message to the Pub/Sub topic and returns its future, for 
+        callers that want to wait on the result themselves.
+
+        Args:
+            data (dict): The data to be published, converted to JSON or protobuf.
+
+        Returns:
+            futures.Future: Resolves to the message ID once the message is sent.
+        """
+        future = self._publish(self.topic_path, self._encode(data))
+        future.add_done_callback(self._on_publish_done)
+        return future
+
+
+    def publish_batch(self, records: List[Any]) -> None:
+        """
+        Publishes each record as its own message without waiting for them to be sent.
+
+        The client sends the messages in as few requests as its batch settings 
+        allow, and `n_confirmed` is incremented as each one is acknowledged. 
+        Flow control blocks the caller if too many messages are outstanding.
+
+        Args:
+            records (List[Any]): The records to be published, one message each.
+
+        Raises:
+            GoogleAPICallError: If an earlier publish failed with an error that 
+                retrying won't fix, such as NotFound or PermissionDenied.
+        """
+        self._raise_fatal_error()
+        publish = self.publish
+        for record in records:
+            publish(record)
+
+
+    def _encode_json(self, data: Any) -> bytes:
+        """Serialises data to compact UTF-8 JSON."""
+        return self._json_encode(data).encode("utf-8")
+
+
+    def _encode_protobuf(self, data: Dict[str, Any]) -> bytes:
+        """
+        Serialises a record to a `google.protobuf.Struct`.
+
+        The data description is only known at runtime, so the well-known Struct 
+        type is used rather than a compiled schema. Note that Struct stores all
+        numbers as doubles.
+        """
+        message = struct_pb2.Struct()
+        message.update(data)
+        return message.SerializeToString()
+
+
+    def close(self) -> None:
+        """
+        Waits for all in-flight messages to be sent, then stops the client.
+
+        Raises:
+            GoogleAPICallError: If a publish failed with an error that retrying 
+                won't fix.
+        """
+        if self.client is None:
+            return
+        futures.wait(list(self._inflight))
+        self._inflight.clear()
+        self.client.stop()
+        self.client = None
+        self._raise_fatal_error()
+
+
+    def _raise_fatal_error(self) -> None:
+        """Raises the first non-retryable publish error, if there has been one."""
+        if self._fatal_error is not None:
+            raise self._fatal_error
+
+
+    def _on_publish_done(self, future: futures.Future) -> None:
+        """
+        Logs the outcome of a publish. Runs on the Pub/Sub client's own thread.
+
+        The client has already retried transient errors. Non-retryable errors 
+        are kept to be raised by the next `publish_batch` or `close`, and only 
+        the first is logged, as every message after it fails the same way.
+        """
+        exception = future.exception()
+        if exception is not None:
+            if isinstance(exception, self.NON_RETRYABLE_ERRORS):
+                with self._confirmed_lock:
+                    if self._fatal_error is not None:
+                        return
+                    self._fatal_error = exception
+            self._handle_errors(exception)
+            return
+
+        with self._confirmed_lock:
+            self.n_confirmed += 1
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Published Pub/Sub message ID: %s to %s", future.result(), self.topic_path)
+
+
+    def _prune_inflight(self) -> None:
+        """Drops finished futures from the front, so `close` only waits on the rest."""
+        while self._inflight and self._inflight[0].done():
+            self._inflight.popleft()
 
 
     def _handle_errors(self, exception: Exception, additional_context: str=''):
         """Handles connection and publishing related errors with descriptive messages."""
 
         # Get the name of the calling function to determine the context
-        calling_function = inspect.stack()[1].function
+        calling_function = sys._getframe(1).f_code.co_name
         context = "connecting" if calling_function == "connect" else "publishing"
 
         # Want to highlight additional context if it's passed
         if additional_context:
             additional_context = f"\nAdditional context: {additional_context}"
 
-        if isinstance(exception, NotFound):
-            error_message = (
-                f"Error during {context} for streaming service: {self.name}: "
-                f"The topic '{self.topic_id}' does not exist in project "
-                f"'{self.project_id}'. Please verify that the topic is created "
-                f"and the project ID is correct.{additional_context}"
-            )
-        elif isinstance(exception, Forbidden):
-            error_message = (
-                f"Error during {context} for streaming service: {self.name}: "
-                f"Permission denied when accessing the topic.\nEnsure the "
-                f"service account has the required Pub/Sub permissions for "
-                f"{self.topic_id} in {self.project_id}.{additional_context}"
-            )
-        elif isinstance(exception, ServiceUnavailable):
-            error_message = (
-                f"Error during {context} for streaming service: {self.name}: "
-                f"Pub/Sub service is unavailable. Please try again later."
-                f"{additional_context}"
-            )
-        elif isinstance(exception, DefaultCredentialsError):
-            error_message = (
-                f"Error during {context} for streaming service: {self.name}: "
-                f"Invalid credentials  for {self.topic_id} in {self.project_id}. "
-                f"Please check your service account credentials."
-                f"{additional_context}"
-            )
-        elif isinstance(exception, GoogleAPIError):
-            error_message = (
-                f"Google API error during {context} for streaming service: "
-                f"{self.name}: {exception}. Please check your Google Cloud "
-                f"configurations and network access.{additional_context}"
-            )
-        elif isinstance(exception, FileNotFoundError):
-            error_message = (
-                f"Error during {context} for streaming service: {self.name}: "
-                f"The credentials file was not found.\nPlease check that you "
-                f"put your Google credentials in the _creds folder, and that "
-                f"the filename is correct.{additional_context}"
-            )
-        elif isinstance(exception, GoogleAuthError):
-            error_message = (
-                f"Error during {context} for streaming service: {self.name}: "
-                f"Google authentication error.\nExiting the application. "
-                f"Please check your credentials and permissions  for "
-                f"{self.topic_id} in {self.project_id}.{additional_context}"
-            )
-        elif isinstance(exception, PermissionDenied):
-            error_message = (
-                f"Error: Permission denied while {context} to streaming service: "
-                f"{self.name}.\nThis likely indicates insufficient permissions "
-                f"for {self.topic_id} in {self.project_id}.{additional_context}"
-            )
-        else:
-            error_message = (
-                f"Unexpected error during {context} for streaming service: "
-                f"{self.name}: {exception}. Please review your configuration "
-                f"and credentials.{additional_context}"
-            )
-
-        print(error_message)
-
+        # Exact type first, then the closest handled parent class
+        template = self._ERROR_TEMPLATES.get(type(exception))
+        if template is None:
+            template = next(
+                (self._ERROR_TEMPLATES[cls] for cls in type(exception).__mro__
+                 if cls in self._ERROR_TEMPLATES),
+                self._TMPL_GENERIC
+                )
 
+        # Copied rather than updated in place, as publish callbacks run on other threads
+        logger.error(template.format_map(
+            {**self._fmt_ctx, "ctx": context, "exception": exception, "extra": additional_context}
+            ))
@@ -1,8 +1,13 @@
-from typing import Any, Dict, List
+import importlib
+import logging
+from queue import Queue
+from threading import Thread
+from typing import Any, Dict, List, Type
 
-from stream_event_handlers import *
+from stream_event_handlers.base import BaseEventHandler
 from data_generator import DataGenerator
 
+logger = logging.getLogger(__name__)
 
 
 class StreamingService:
@@ -14,13 +19,20 @@ class StreamingService:
     
     Attributes:
         interval (int): Interval in seconds between data streaming operations.
-        n_records_pushed (int): Counter for the number of records pushed to the streaming service.
+        n_records_pushed (int): Number of records the streaming service has confirmed receiving.
         service_name (str): Name of the streaming service being used.
         event_handler (BaseEventHandler): The active event handler responsible for streaming data.
+        publish_queue (queue.Queue): Bounded queue handing generated blocks to the 
+            service's publishing thread.
     """
+    # Maximum number of generated blocks waiting to be published
+    PUBLISH_QUEUE_SIZE = 128
 
+
+    # Handlers are given as "module:class" and only imported when a service uses 
+    #  them, so the client libraries of unused services are never loaded
     EVENT_HANDLER_LOOKUP = {
-        'pubsub' : PubSubEventHandler
+        'pubsub' : 'stream_event_handlers.pubsub_handler:PubSubEventHandler'
         # Add other handlers here as needed
     }
     
@@ -36,8 +48,6 @@ class StreamingService:
         Raises:
             ValueError: If the specified service name is not supported.
         """
-        self.n_records_pushed = 0
-
         self.service_name = config.name
         self.interval = config.interval
         self.block_size = config.size
@@ -45,29 +55,103 @@ class StreamingService:
         self.connection_details = config.connection
         self.data_description = config.data_description
 
-        self.data_generator = DataGenerator(self.data_description, config.datetime_format_string)
+        self.data_generator = DataGenerator(
+            self.data_description, 
+            config.datetime_format_string,
+            seed=config.seed
+            )
 
         self.connect_to = self.connection_details.service
 
         # Validate service type, create event handler and connect
-        if self.connect_to not in self.EVENT_HANDLER_LOOKUP:
+        handler_path = self.EVENT_HANDLER_LOOKUP.get(self.connect_to)
+        if handler_path is None:
             raise ValueError(f"Service '{self.connect_to}' is not supported.")
         
-        self.event_handler = self.EVENT_HANDLER_LOOKUP[self.connect_to](config)
+        handler_class = self._load_event_handler(handler_path)
+        self.event_handler = handler_class(config)
         self.event_handler.connect()
-        
+        # Bound once, as it's called for every block
+        self._publish_batch = self.event_handler.publish_batch
+
+        # Publishes on its own thread, so that network I/O doesn't hold up data 
+        #  generation. Daemon thread, as it blocks on the queue until closed
+        self.publish_queue = Queue(maxsize=self.PUBLISH_QUEUE_SIZE)
+        # First error raised while publishing, raised again by push
+        self._publish_error = None
+        self._publishing_thread = Thread(target=self._run_publisher, daemon=True)
+        self._publishing_thread.start()
+
+    @staticmethod
+    def _load_event_handler(path: str) -> Type[BaseEventHandler]:
+        """
+        Imports an event handler class from a "module:class" path.
+
+        Args:
+            path (str): Module and class name of the handler, separated by a colon.
+
+        Returns:
+            Type[BaseEventHandler]: The event handler class.
+        """
+        module_name, class_name = path.split(":")
+        return getattr(importlib.import_module(module_name), class_name)
+
+    @property
+    def n_records_pushed(self) -> int:
+        """Number of records the event handler has confirmed were delivered."""
+        return self.event_handler.n_confirmed
+
     def push(self, data: List[Dict[str, Any]]) -> None:
         """
-        Publishes a data record to the event handler and increments the push counter.
+        Queues a block of data records to be published by the event handler, one 
+        message per record. Blocks if the queue is full. Doesn't wait for the 
+        records to be sent; `n_records_pushed` only counts records once their 
+        delivery is confirmed.
         
         Args:
-            data (Dict[str, Any]): Data record to be published.
+            data (List[Dict[str, Any]]): Data records to be published.
+
+        Raises:
+            Exception: The error that stopped an earlier block from being published.
         """
-        self.event_handler.publish(data)
-        self.n_records_pushed += self.block_size
+        if self._publish_error is not None:
+            raise self._publish_error
+        self.publish_queue.put(data)
 
     def generate(self) -> List:
         """
         Generates a chunk of data
         """
-        return self.data_generator.generate(num_records=self.block_size)
\ No newline at end of file
+        return self.data_generator.generate(num_records=self.block_size)
+
+    def close(self) -> None:
+        """
+        Publishes any blocks still queued, flushes any data still being published 
+        and closes the event handler.
+        """
+        if self._publishing_thread.is_alive():
+            self.publish_queue.join()
+            self.publish_queue.put(None)
+            self._publishing_thread.join()
+        self.event_handler.close()
+
+    def _run_publisher(self) -> None:
+        """
+        Publishes queued blocks of data until a None block is queued by `close`.
+
+        Once publishing fails, later blocks are dropped rather than published, 
+        so the queue doesn't back up while `push` raises the error.
+        """
+        while True:
+            data = self.publish_queue.get()
+            try:
+                if data is None:
+                    return
+                if self._publish_error is None:
+                    self._publish_batch(data)
+                    logger.debug("Published %d records for streaming service: %s", len(data), self.service_name)
+            except Exception as e:
+                self._publish_error = e
+                logger.exception("Failed to publish data for streaming service: %s", self.service_name)
+            finally:
+                self.publish_queue.task_done()
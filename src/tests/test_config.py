@@ -1,6 +1,9 @@
 import unittest
-import os
+from unittest import mock
 import json
+import os
+import tempfile
+from types import MappingProxyType
 from pydantic import ValidationError
 
 from config import Config
@@ -79,6 +82,53 @@ TEST_DATA_DESCRIPTION = [
         }
     ]
 
+def _without(fixture, key):
+    """Returns a copy of a fixture dict without `key`."""
+    return {k: v for k, v in fixture.items() if k != key}
+
+# Each field in TEST_DATA_DESCRIPTION, looked up once rather than in every test.
+#  Read-only views, so a test can't change the fixtures shared by other tests
+FIELDS_BY_TYPE = {field['data_type']: MappingProxyType(field) for field in TEST_DATA_DESCRIPTION}
+
+# Each field without a required key, built once for the missing-key tests
+FIELDS_WITHOUT_NAME = {
+    data_type: MappingProxyType(_without(field, 'name'))
+    for data_type, field in FIELDS_BY_TYPE.items()
+}
+FIELDS_WITHOUT_ALLOWABLE_VALUES = {
+    data_type: MappingProxyType(_without(field, 'allowable_values'))
+    for data_type, field in FIELDS_BY_TYPE.items()
+    if 'allowable_values' in field
+}
+
+FIELD_MODELS = {
+    'category': CategoryField,
+    'integer': IntegerField,
+    'float': FloatField,
+    'bool': BoolField,
+    'date': DateField,
+    'datetime': DateTimeField
+}
+
+# Invalid settings for each field type, as (data_type, case, overriding values)
+INVALID_FIELD_VALUES = [
+    ('category', 'allowable_values_min_length', {'allowable_values': []}),
+    ('category', 'allowable_values_max_length', {'allowable_values': ['a'] * 200}),
+    ('integer', 'allowable_values_min_length', {'allowable_values': [5]}),
+    ('integer', 'allowable_values_max_length', {'allowable_values': [5, 6, 7]}),
+    ('integer', 'allowable_values_different', {'allowable_values': [5, 5]}),
+    ('float', 'allowable_values_min_length', {'allowable_values': [0.0]}),
+    ('float', 'allowable_values_max_length', {'allowable_values': [5, 6, 7]}),
+    ('float', 'allowable_values_different', {'allowable_values': [5, 5]}),
+    ('float', 'decimal_places_not_negative', {'decimal_places': -1}),
+    ('date', 'allowable_values_min_length', {'allowable_values': ["2024-01-01"]}),
+    ('date', 'allowable_values_max_length', {'allowable_values': ["2024-01-01", "2024-03-01", "2024-01-03"]}),
+    ('date', 'allowable_values_different', {'allowable_values': ["2024-01-01", "2024-01-01"]}),
+    ('datetime', 'allowable_values_min_length', {'allowable_values': ["2024-01-01 00:00:00"]}),
+    ('datetime', 'allowable_values_max_length', {'allowable_values': ["2024-01-01 00:00:00", "2024-01-02 00:00:00", "2024-01-03 00:00:00"]}),
+    ('datetime', 'allowable_values_different', {'allowable_values': ["2024-01-01 00:00:00", "2024-01-01 00:00:00"]}),
+]
+
 TEST_CONFIG_DICT = { 
     "version": "2.0",
     "streaming" : [
@@ -115,20 +165,25 @@ TEST_CONFIG_DICT = {
     ]      
 }
 
+# TEST_CONFIG_DICT as the contents of a config file, serialised once. Bytes, 
+#  as Config.from_json reads the file in binary mode
+TEST_CONFIG_JSON = json.dumps(TEST_CONFIG_DICT).encode("utf-8")
+
+
 class TestConfig(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        """Create a temporary configuration file for testing."""
-        cls.test_config_path = os.path.join(os.path.dirname(__file__), 'test_config.json')
-        with open(cls.test_config_path, 'w') as f:
-            json.dump(TEST_CONFIG_DICT, f)
+        """
+        Load the test configuration through a mocked file once, into a Config 
+        shared by the read-only tests.
+        """
+        cls.test_config_path = 'test_config.json'
+        cls.test_config_json = TEST_CONFIG_JSON
 
-    @classmethod
-    def tearDownClass(cls):
-        """Remove the temporary configuration file after tests."""
-        if os.path.isfile(cls.test_config_path):
-            os.remove(cls.test_config_path)
+        with mock.patch("builtins.open", mock.mock_open(read_data=cls.test_config_json)) as mocked_open:
+            cls.config = Config.from_json(cls.test_config_path)
+        cls.opened_path = mocked_open.call_args.args[0]
 
     def test_load_config_from_dict(self):
         config = Config.from_dict(TEST_CONFIG_DICT)
@@ -136,31 +191,32 @@ class TestConfig(unittest.TestCase):
 
     def test_load_config_from_json(self):
         """Test if the configuration loads correctly."""
-        config = Config.from_json(self.test_config_path)
-        
+        self.assertTrue(self.opened_path.endswith(self.test_config_path))
+        self.assertIsInstance(self.config, Config)
+
         # Test general properties of the config
-        self.assertEqual(config.version, "2.0")
-        self.assertEqual(len(config.streaming_configs), 1)  # Only 1 streaming config in the test data
-        self.assertEqual(len(config.batch_configs), 2)  # 2 batch configs in the test data
-        
-        # Test specific streaming configuration values
-        streaming_config = config.streaming_configs[0]
+        self.assertEqual(self.config.version, "2.0")
+        self.assertEqual(len(self.config.streaming_configs), 1)  # Only 1 streaming config in the test data
+        self.assertEqual(len(self.config.batch_configs), 2)  # 2 batch configs in the test data
+
+    def test_streaming_config_values(self):
+        streaming_config = self.config.streaming_configs[0]
         self.assertEqual(streaming_config.name, "streaming")
         self.assertEqual(streaming_config.interval, 10)
         self.assertEqual(streaming_config.size, 3)
         self.assertFalse(streaming_config.randomise)
-        
-        # Test streaming connection details
-        connection = streaming_config.connection
+
+    def test_streaming_connection_values(self):
+        connection = self.config.streaming_configs[0].connection
         self.assertEqual(connection.service, "pubsub")
         self.assertEqual(connection.project_id, "fakeout-440306")
         self.assertEqual(connection.topic_id, "feakeout-receive-2")
         self.assertEqual(connection.credentials_path, "GOOGLE_APPLICATION_CREDENTIALS.json")
-        
-        # Test data description for streaming
-        data_description = streaming_config.data_description
+
+    def test_streaming_data_description(self):
+        data_description = self.config.streaming_configs[0].data_description
         self.assertEqual(len(data_description), 6)
-        
+
         # Validate individual data fields in the streaming config
         machine_id_field = data_description[0]
         self.assertEqual(machine_id_field.name, "sensor_id")
@@ -176,25 +232,25 @@ class TestConfig(unittest.TestCase):
         self.assertEqual(value_2_field.name, "integer_1")
         self.assertEqual(value_2_field.data_type, "integer")
         self.assertEqual(len(value_2_field.allowable_values), 2)
-        
-        # Test specific batch configuration values
-        batch_config = config.batch_configs[0]
+
+    def test_batch_config_values(self):
+        batch_config = self.config.batch_configs[0]
         self.assertEqual(batch_config.name, "batch_local")
         self.assertEqual(batch_config.interval, 30)
         self.assertEqual(batch_config.size, 1000)
         self.assertEqual(batch_config.filetype, "json")
         self.assertFalse(batch_config.randomise)
-        
-        # Test batch connection details
-        batch_connection = batch_config.connection
+
+    def test_batch_connection_values(self):
+        batch_connection = self.config.batch_configs[0].connection
         self.assertEqual(batch_connection.service, "local")
         self.assertEqual(batch_connection.port, "8080")
         self.assertEqual(batch_connection.folder_path, "your-folder-path")
-        
-        # Test data description for batch
-        batch_data_description = batch_config.data_description
+
+    def test_batch_data_description(self):
+        batch_data_description = self.config.batch_configs[0].data_description
         self.assertEqual(len(batch_data_description), 6)
-        
+
         # Validate individual data fields in the batch config
         sensor_id_field = batch_data_description[0]
         self.assertEqual(sensor_id_field.name, "sensor_id")
@@ -206,34 +262,33 @@ class TestConfig(unittest.TestCase):
         self.assertEqual(value_field.data_type, "float")
         self.assertEqual(len(value_field.allowable_values), 2)
 
-        # Test the overall length of the config's root fields
-        self.assertEqual(len(config.streaming_configs[0].data_description), 6)
-        self.assertEqual(len(config.batch_configs[0].data_description), 6)
-
+    def test_data_description_field_types(self):
         # Test the data_description field of each config for type consistency (e.g., DataField)
-        for field in config.streaming_configs[0].data_description:
+        for field in self.config.streaming_configs[0].data_description:
             self.assertTrue(isinstance(field, DATA_FIELD_TYPES))  # Ensure fields are instances of DataField classes (e.g., CategoryField, IntegerField, etc.)
         
-        for field in config.batch_configs[0].data_description:
+        for field in self.config.batch_configs[0].data_description:
             self.assertTrue(isinstance(field, DATA_FIELD_TYPES))  # Same check for batch config data fields
 
+    def test_load_config_from_json_bytes(self):
+        self.assertEqual(
+            Config.from_json_bytes(self.test_config_json), Config.from_dict(TEST_CONFIG_DICT)
+            )
 
     def test_missing_file(self):
         """Test if FileNotFoundError is raised for a missing config file."""
-        with self.assertRaises(FileNotFoundError):
-            Config.from_json('non_existent_config.json')
+        # An empty temporary directory, so the file can't exist whatever is in the repo
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with self.assertRaises(FileNotFoundError):
+                Config.from_json(os.path.join(temp_dir, 'non_existent_config.json'))
 
     def test_invalid_json(self):
-        """Test if json.JSONDecodeError is raised for an invalid JSON file."""
-        invalid_config_path = os.path.join(os.path.dirname(__file__), 'invalid_config.json')
-        with open(invalid_config_path, 'w') as f:
-            f.write("{ invalid_json }")  # Invalid JSON
-        
-        with self.assertRaises(json.JSONDecodeError):
-            Config.from_json(invalid_config_path)
-        
-        # Cleanup
-        os.remove(invalid_config_path)
+        """Test if a ValidationError is raised for an invalid JSON file."""
+        invalid_json = b"{ invalid_json }"
+        with mock.patch("builtins.open", mock.mock_open(read_data=invalid_json)):
+            with self.assertRaises(ValidationError) as context:
+                Config.from_json('invalid_config.json')
+        self.assertEqual(context.exception.errors()[0]["type"], "json_invalid")
 
     def test_config_with_all_required_keys(self):
         # This test should pass without any exceptions
@@ -241,8 +296,7 @@ class TestConfig(unittest.TestCase):
         assert config.version == "2.0"
 
     def test_missing_version(self):
-        config_data = TEST_CONFIG_DICT.copy()
-        del config_data["version"]  # Remove the 'version' key
+        config_data = _without(TEST_CONFIG_DICT, "version")
         with self.assertRaises(ValidationError) as context:
             Config.from_dict(config_data)
         self.assertIn("version", str(context.exception))
@@ -252,280 +306,158 @@ class TestConfig(unittest.TestCase):
 class TestStreamingConfig(unittest.TestCase):
     def test_streaming_config_has_name(self):
         """Test that 'name' is required in streaming config."""
-        streaming_config = TEST_CONFIG_DICT['streaming'][0].copy()
-        del streaming_config['name']
+        streaming_config = _without(TEST_CONFIG_DICT['streaming'][0], 'name')
         with self.assertRaises(ValidationError):
-            _ = StreamingConfig(**streaming_config)
+            _ = StreamingConfig.model_validate(streaming_config)
 
     def test_streaming_config_has_data_description(self):
         """Test that 'data_description' is required in streaming config."""
-        streaming_config = TEST_CONFIG_DICT['streaming'][0].copy()
-        del streaming_config['data_description']
+        streaming_config = _without(TEST_CONFIG_DICT['streaming'][0], 'data_description')
         with self.assertRaises(ValidationError):
-            _ = StreamingConfig(**streaming_config)
+            _ = StreamingConfig.model_validate(streaming_config)
 
     def test_streaming_config_has_connection(self):
         """Test that 'connection' is required in streaming config."""
-        streaming_config = TEST_CONFIG_DICT['streaming'][0].copy()
-        del streaming_config['connection']
+        streaming_config = _without(TEST_CONFIG_DICT['streaming'][0], 'connection')
         with self.assertRaises(ValidationError):
-            _ = StreamingConfig(**streaming_config)
+            _ = StreamingConfig.model_validate(streaming_config)
 
 
 class TestBatchConfig(unittest.TestCase):
     def test_batch_config_has_name(self):
         """Test that 'name' is required in batch config."""
-        batch_config = TEST_CONFIG_DICT['batch'][0].copy()
-        del batch_config['name']
+        batch_config = _without(TEST_CONFIG_DICT['batch'][0], 'name')
         with self.assertRaises(ValidationError):
-            _ = BatchConfig(**batch_config)
+            _ = BatchConfig.model_validate(batch_config)
 
     def test_batch_config_has_data_description(self):
         """Test that 'data_description' is required in batch config."""
-        batch_config = TEST_CONFIG_DICT['batch'][0].copy()
-        del batch_config['data_description']
+        batch_config = _without(TEST_CONFIG_DICT['batch'][0], 'data_description')
         with self.assertRaises(ValidationError):
-            _ = BatchConfig(**batch_config)
+            _ = BatchConfig.model_validate(batch_config)
 
     def test_batch_config_has_connection(self):
         """Test that 'connection' is required in batch config."""
-        batch_config = TEST_CONFIG_DICT['batch'][0].copy()
-        del batch_config['connection']
+        batch_config = _without(TEST_CONFIG_DICT['batch'][0], 'connection')
         with self.assertRaises(ValidationError):
-            _ = BatchConfig(**batch_config)
+            _ = BatchConfig.model_validate(batch_config)
 
     
         
 class TestDataModels(unittest.TestCase):
-    def test_categorical_data_def_has_name(self):
-        categorical_field = next(field for field in TEST_DATA_DESCRIPTION if field['data_type'] == "category").copy()
-        del categorical_field['name']
-        with self.assertRaises(ValidationError):
-            _ = CategoryField(**categorical_field)
+    def test_data_def_has_name(self):
+        for data_type, field in FIELDS_WITHOUT_NAME.items():
+            with self.subTest(data_type=data_type):
+                with self.assertRaises(ValidationError):
+                    _ = FIELD_MODELS[data_type].model_validate(field)
 
-    def test_categorical_data_def_has_allowable_values(self):
-        categorical_field = next(field for field in TEST_DATA_DESCRIPTION if field['data_type'] == "category").copy()
-        del categorical_field['allowable_values']
-        with self.assertRaises(ValidationError):
-            _ = CategoryField(**categorical_field)
+    def test_data_def_has_allowable_values(self):
+        for data_type, field in FIELDS_WITHOUT_ALLOWABLE_VALUES.items():
+            with self.subTest(data_type=data_type):
+                with self.assertRaises(ValidationError):
+                    _ = FIELD_MODELS[data_type].model_validate(field)
 
-    def test_categorical_data_def_allowable_values_min_length(self):
-        categorical_field = next(field for field in TEST_DATA_DESCRIPTION if field['data_type'] == "category").copy()
-        categorical_field['allowable_values'] = []
-        with self.assertRaises(ValidationError):
-            _ = CategoryField(**categorical_field)
-
-    def test_categorical_data_def_allowable_values_max_length(self):
-        categorical_field = next(field for field in TEST_DATA_DESCRIPTION if field['data_type'] == "category").copy()
-        categorical_field['allowable_values'] = ['a' for i in range(200)]
-        with self.assertRaises(ValidationError):
-            _ = CategoryField(**categorical_field)
+    def test_data_def_rejects_invalid_values(self):
+        for data_type, case, overrides in INVALID_FIELD_VALUES:
+            with self.subTest(data_type=data_type, case=case):
+                with self.assertRaises(ValidationError):
+                    _ = FIELD_MODELS[data_type].model_validate({**FIELDS_BY_TYPE[data_type], **overrides})
 
-    def test_integer_data_def_has_name(self):
-        integer_field = next(field for field in TEST_DATA_DESCRIPTION if field['data_type'] == "integer").copy()
-        del integer_field['name']
-        with self.assertRaises(ValidationError):
-            _ = IntegerField(**integer_field)
-
-    def test_integer_data_def_has_allowable_values(self):
-        integer_field = next(field for field in TEST_DATA_DESCRIPTION if field['data_type'] == "integer").copy()
-        del integer_field['allowable_values']
-        with self.assertRaises(ValidationError):
-            _ = IntegerField(**integer_field)
 
-    def test_integer_data_def_allowable_values_min_length(self):
-        integer_field = next(field for field in TEST_DATA_DESCRIPTION if field['data_type'] == "integer").copy()
-        integer_field['allowable_values'] = [5]
-        with self.assertRaises(ValidationError):
-            _ = IntegerField(**integer_field)
-
-    def test_integer_data_def_allowable_values_max_length(self):
-        integer_field = next(field for field in TEST_DATA_DESCRIPTION if field['data_type'] == "integer").copy()
-        integer_field['allowable_values'] = [5, 6, 7]
-        with self.assertRaises(ValidationError):
-            _ = IntegerField(**integer_field)
-
-    def test_integer_data_def_allowable_values_different(self):
-        integer_field = next(field for field in TEST_DATA_DESCRIPTION if field['data_type'] == "integer").copy()
-        integer_field['allowable_values'] = [5, 5]
-        with self.assertRaises(ValidationError):
-            _ = IntegerField(**integer_field)
-
-    def test_float_data_def_has_name(self):
-        float_field = next(field for field in TEST_DATA_DESCRIPTION if field['data_type'] == "float").copy()
-        del float_field['name']
-        with self.assertRaises(ValidationError):
-            _ = FloatField(**float_field)
-
-    def test_float_data_def_has_allowable_values(self):
-        float_field = next(field for field in TEST_DATA_DESCRIPTION if field['data_type'] == "float").copy()
-        del float_field['allowable_values']
-        with self.assertRaises(ValidationError):
-            _ = FloatField(**float_field)
-
-    def test_float_data_def_allowable_values_min_length(self):
-        float_field = next(field for field in TEST_DATA_DESCRIPTION if field['data_type'] == "float").copy()
-        float_field['allowable_values'] = [0.0]
-        with self.assertRaises(ValidationError):
-            _ = FloatField(**float_field)
-
-    def test_float_data_def_allowable_values_max_length(self):
-        float_field = next(field for field in TEST_DATA_DESCRIPTION if field['data_type'] == "float").copy()
-        float_field['allowable_values'] = [5, 6, 7]
-        with self.assertRaises(ValidationError):
-            _ = IntegerField(**float_field)
-
-    def test_float_data_def_allowable_values_different(self):
-        float_field = next(field for field in TEST_DATA_DESCRIPTION if field['data_type'] == "float").copy()
-        float_field['allowable_values'] = [5, 5]
-        with self.assertRaises(ValidationError):
-            _ = IntegerField(**float_field)
-
-    def test_bool_data_def_has_name(self):
-        bool_field = next(field for field in TEST_DATA_DESCRIPTION if field['data_type'] == "bool").copy()
-        del bool_field['name']
-        with self.assertRaises(ValidationError):
-            _ = BoolField(**bool_field)
-
-    def test_date_data_def_has_name(self):
-        date_field = next(field for field in TEST_DATA_DESCRIPTION if field['data_type'] == "date").copy()
-        del date_field['name']
-        with self.assertRaises(ValidationError):
-            _ = DateField(**date_field)
-
-    def test_date_data_def_has_allowable_values(self):
-        date_field = next(field for field in TEST_DATA_DESCRIPTION if field['data_type'] == "date").copy()
-        del date_field['allowable_values']
-        with self.assertRaises(ValidationError):
-            _ = DateField(**date_field)
-
-    def test_date_data_def_allowable_values_min_length(self):
-        date_field = next(field for field in TEST_DATA_DESCRIPTION if field['data_type'] == "date").copy()
-        date_field['allowable_values'] = ["2024-01-01"]
-        with self.assertRaises(ValidationError):
-            _ = DateField(**date_field)
-
-    def test_date_data_def_allowable_values_max_length(self):
-        date_field = next(field for field in TEST_DATA_DESCRIPTION if field['data_type'] == "date").copy()
-        date_field['allowable_values'] = ["2024-01-01", "2024-03-01", "2024-01-03"]
-        with self.assertRaises(ValidationError):
-            _ = DateField(**date_field)
-
-    def test_date_data_def_allowable_values_different(self):
-        date_field = next(field for field in TEST_DATA_DESCRIPTION if field['data_type'] == "date").copy()
-        date_field['allowable_values'] = ["2024-01-01", "2024-01-01"]
-        with self.assertRaises(ValidationError):
-            _ = DateField(**date_field)
-
-    def test_datetime_data_def_has_name(self):
-        datetime_field = next(field for field in TEST_DATA_DESCRIPTION if field['data_type'] == "datetime").copy()
-        del datetime_field['name']
-        with self.assertRaises(ValidationError):
-            _ = DateTimeField(**datetime_field)
-
-    def test_datetime_data_def_has_allowable_values(self):
-        datetime_field = next(field for field in TEST_DATA_DESCRIPTION if field['data_type'] == "datetime").copy()
-        del datetime_field['allowable_values']
-        with self.assertRaises(ValidationError):
-            _ = DateTimeField(**datetime_field)
-
-    def test_datetime_data_def_allowable_values_min_length(self):
-        datetime_field = next(field for field in TEST_DATA_DESCRIPTION if field['data_type'] == "datetime").copy()
-        datetime_field['allowable_values'] = ["2024-01-01 00:00:00"]
-        with self.assertRaises(ValidationError):
-            _ = DateTimeField(**datetime_field)
-
-    def test_datetime_data_def_allowable_values_max_length(self):
-        datetime_field = next(field for field in TEST_DATA_DESCRIPTION if field['data_type'] == "datetime").copy()
-        datetime_field['allowable_values'] = ["2024-01-01 00:00:00", "2024-01-02 00:00:00", "2024-01-03 00:00:00"]
-        with self.assertRaises(ValidationError):
-            _ = DateTimeField(**datetime_field)
-
-    def test_datetime_data_def_allowable_values_different(self):
-        datetime_field = next(field for field in TEST_DATA_DESCRIPTION if field['data_type'] == "datetime").copy()
-        datetime_field['allowable_values'] = ["2024-01-01 00:00:00", "2024-01-01 00:00:00"]
-        with self.assertRaises(ValidationError):
-            _ = DateTimeField(**datetime_field)
-
-    
 class TestBatchLocalCreds(unittest.TestCase):
     def test_local_creds_has_service(self):
-        creds = TEST_LOCAL_BATCH_CREDS.copy()
-        del creds['service']
+        creds = _without(TEST_LOCAL_BATCH_CREDS, 'service')
         with self.assertRaises(ValidationError):
-            _ = BatchLocalCreds(**creds)
+            _ = BatchLocalCreds.model_validate(creds)
 
     def test_local_creds_has_port(self):
-        creds = TEST_LOCAL_BATCH_CREDS.copy()
-        del creds['port']
+        creds = _without(TEST_LOCAL_BATCH_CREDS, 'port')
         with self.assertRaises(ValidationError):
-            _ = BatchLocalCreds(**creds)
+            _ = BatchLocalCreds.model_validate(creds)
 
     def test_local_creds_has_folder_path(self):
-        creds = TEST_LOCAL_BATCH_CREDS.copy()
-        del creds['folder_path']
+        creds = _without(TEST_LOCAL_BATCH_CREDS, 'folder_path')
         # Optional field, should not raise an error
-        model_instance = BatchLocalCreds(**creds)
+        model_instance = BatchLocalCreds.model_validate(creds)
         self.assertEqual(model_instance.folder_path, '')
 
 
 class TestBatchConnectionCredsGCP(unittest.TestCase):
     def test_gcp_creds_has_service(self):
-        creds = TEST_GCP_STORAGE_BATCH_CREDS.copy()
-        del creds['service']
+        creds = _without(TEST_GCP_STORAGE_BATCH_CREDS, 'service')
         with self.assertRaises(ValidationError):
-            _ = BatchConnectionCredsGCP(**creds)
+            _ = BatchConnectionCredsGCP.model_validate(creds)
 
     def test_gcp_creds_has_project_id(self):
-        creds = TEST_GCP_STORAGE_BATCH_CREDS.copy()
-        del creds['project_id']
+        creds = _without(TEST_GCP_STORAGE_BATCH_CREDS, 'project_id')
         with self.assertRaises(ValidationError):
-            _ = BatchConnectionCredsGCP(**creds)
+            _ = BatchConnectionCredsGCP.model_validate(creds)
 
     def test_gcp_creds_has_bucket_name(self):
-        creds = TEST_GCP_STORAGE_BATCH_CREDS.copy()
-        del creds['bucket_name']
+        creds = _without(TEST_GCP_STORAGE_BATCH_CREDS, 'bucket_name')
         with self.assertRaises(ValidationError):
-            _ = BatchConnectionCredsGCP(**creds)
+            _ = BatchConnectionCredsGCP.model_validate(creds)
 
     def test_gcp_creds_has_credentials_path(self):
-        creds = TEST_GCP_STORAGE_BATCH_CREDS.copy()
-        del creds['credentials_path']
+        creds = _without(TEST_GCP_STORAGE_BATCH_CREDS, 'credentials_path')
         with self.assertRaises(ValidationError):
-            _ = BatchConnectionCredsGCP(**creds)
+            _ = BatchConnectionCredsGCP.model_validate(creds)
 
     def test_gcp_creds_folder_path_optional(self):
-        creds = TEST_GCP_STORAGE_BATCH_CREDS.copy()
-        del creds['folder_path']
+        creds = _without(TEST_GCP_STORAGE_BATCH_CREDS, 'folder_path')
         # Optional field, should not raise an error
-        model_instance = BatchConnectionCredsGCP(**creds)
+        model_instance = BatchConnectionCredsGCP.model_validate(creds)
         self.assertEqual(model_instance.folder_path, '')
 
 
 class TestStreamingConnectionCredsPubSub(unittest.TestCase):
     def test_pubsub_creds_has_service(self):
-        creds = TEST_PUBSUB_STREAMING_CREDS.copy()
-        del creds['service']
+        creds = _without(TEST_PUBSUB_STREAMING_CREDS, 'service')
         with self.assertRaises(ValidationError):
-            _ = StreamingConnectionCredsPubSub(**creds)
+            _ = StreamingConnectionCredsPubSub.model_validate(creds)
 
     def test_pubsub_creds_has_project_id(self):
-        creds = TEST_PUBSUB_STREAMING_CREDS.copy()
-        del creds['project_id']
+        creds = _without(TEST_PUBSUB_STREAMING_CREDS, 'project_id')
         with self.assertRaises(ValidationError):
-            _ = StreamingConnectionCredsPubSub(**creds)
+            _ = StreamingConnectionCredsPubSub.model_validate(creds)
 
     def test_pubsub_creds_has_topic_id(self):
-        creds = TEST_PUBSUB_STREAMING_CREDS.copy()
-        del creds['topic_id']
+        creds = _without(TEST_PUBSUB_STREAMING_CREDS, 'topic_id')
         with self.assertRaises(ValidationError):
-            _ = StreamingConnectionCredsPubSub(**creds)
+            _ = StreamingConnectionCredsPubSub.model_validate(creds)
 
     def test_pubsub_creds_has_credentials_path(self):
+        creds = _without(TEST_PUBSUB_STREAMING_CREDS, 'credentials_path')
+        with self.assertRaises(ValidationError):
+            _ = StreamingConnectionCredsPubSub.model_validate(creds)
+
+    def test_pubsub_creds_batch_settings_optional(self):
+        # Optional fields, should not raise an error
+        model_instance = StreamingConnectionCredsPubSub.model_validate(TEST_PUBSUB_STREAMING_CREDS)
+        self.assertEqual(model_instance.max_messages, 1000)
+        self.assertEqual(model_instance.max_bytes, 1_000_000)
+        self.assertEqual(model_instance.max_latency, 0.05)
+        self.assertEqual(model_instance.max_outstanding_messages, 10_000)
+        self.assertTrue(model_instance.compression)
+
+    def test_pubsub_creds_message_format(self):
+        creds = TEST_PUBSUB_STREAMING_CREDS.copy()
+        self.assertEqual(StreamingConnectionCredsPubSub.model_validate(creds).message_format, 'json')
+        creds['message_format'] = 'xml'
+        with self.assertRaises(ValidationError):
+            _ = StreamingConnectionCredsPubSub.model_validate(creds)
+
+    def test_pubsub_creds_max_messages_limit(self):
+        creds = TEST_PUBSUB_STREAMING_CREDS.copy()
+        creds['max_messages'] = 1001
+        with self.assertRaises(ValidationError):
+            _ = StreamingConnectionCredsPubSub.model_validate(creds)
+
+    def test_pubsub_creds_max_bytes_limit(self):
         creds = TEST_PUBSUB_STREAMING_CREDS.copy()
-        del creds['credentials_path']
+        creds['max_bytes'] = 20_000_000
         with self.assertRaises(ValidationError):
-            _ = StreamingConnectionCredsPubSub(**creds)
+            _ = StreamingConnectionCredsPubSub.model_validate(creds)
     
 
 if __name__ == '__main__':
@@ -1,5 +1,8 @@
 import unittest
 from datetime import datetime
+from unittest import mock
+
+import numpy as np
 from data_generator import DataGenerator
 from config.config import DataDescription
 
@@ -21,6 +24,7 @@ class TestDataGenerator(unittest.TestCase):
         self.data_description = DataDescription(self.data_description)
         self.datetime_format = "%Y-%m-%d %H:%M:%S"
         self.generator = DataGenerator(self.data_description, self.datetime_format)
+        self.fields_by_type = {field.data_type: field for field in self.data_description}
 
     def test_initialization(self):
         self.assertEqual(self.generator.data_description, self.data_description)
@@ -33,13 +37,126 @@ class TestDataGenerator(unittest.TestCase):
         self.assertEqual(len(records), 5)
         self.assertIn("generated_at", records[0])
 
+    def test_generate_columns(self):
+        columns = self.generator.generate_columns(50)
+        self.assertEqual(
+            list(columns), ["generated_at"] + [field.name for field in self.data_description]
+            )
+        for values in columns.values():
+            self.assertEqual(len(values), 50)
+
+        self.assertTrue(all(isinstance(v, int) for v in columns["integer_field"]))
+        self.assertTrue(all(0 <= v <= 10 for v in columns["integer_field"]))
+        self.assertTrue(all(isinstance(v, float) for v in columns["float_field"]))
+        self.assertTrue(all(isinstance(v, bool) for v in columns["bool_field"]))
+        self.assertTrue(set(columns["category_field"]) <= {"A", "B", "C"})
+        for value in columns["date_field"]:
+            self.assertTrue("2023-01-01" <= value <= "2023-12-31")
+            datetime.strptime(value, "%Y-%m-%d")
+        for value in columns["datetime_field"]:
+            self.assertTrue("2023-01-01 00:00:00" <= value <= "2023-12-31 23:59:59")
+            datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
+
+    def test_generate_columns_null_values(self):
+        for proportion_nulls, expected in [(0, 0.0), (0.5, 0.5), (1, 1.0)]:
+            for data_type in df.DATA_TYPES:
+                with self.subTest(data_type=data_type, proportion_nulls=proportion_nulls):
+                    generator = DataGenerator(DataDescription([{
+                        "name": f"test_{data_type}",
+                        "data_type": data_type,
+                        "proportion_nulls": proportion_nulls,
+                        "allowable_values": df.ALLOWABLE_VALUES_MAPPING[data_type]
+                    }]), self.datetime_format)
+                    values = generator.generate_columns(10000)[f"test_{data_type}"]
+                    null_proportion = values.count(None) / len(values)
+                    self.assertAlmostEqual(null_proportion, expected, delta=0.05)
+
+    def test_date_lookup_tables_match_formatted_dates(self):
+        description = DataDescription([
+            {"name": "date_field", "data_type": "date", "allowable_values": ["2020-02-27", "2020-03-02"]},
+            {"name": "datetime_field", "data_type": "datetime", "allowable_values": ["2020-02-28 13:14:15", "2020-03-01 01:02:03"]}
+        ])
+        for field_config in description:
+            with self.subTest(data_type=field_config.data_type):
+                fn = self.generator.column_lookup[field_config.data_type]
+                self.generator.rng = np.random.default_rng(0)
+                from_tables = fn(field_config, 1000)
+                self.generator.rng = np.random.default_rng(0)
+                with mock.patch("data_generator.data_generator.MAX_DATE_TABLE_DAYS", 0):
+                    formatted = fn(field_config, 1000)
+                self.assertEqual(from_tables, formatted)
+
+    def test_date_bounds_without_leading_zeros(self):
+        description = DataDescription([
+            {"name": "date_field", "data_type": "date", "allowable_values": ["2023-1-5", "2023-1-7"]},
+            {"name": "datetime_field", "data_type": "datetime", "allowable_values": ["2023-1-5 0:00:00", "2023-1-5 0:00:09"]}
+        ])
+        generator = DataGenerator(description, self.datetime_format)
+        columns = generator.generate_columns(100)
+        self.assertTrue(set(columns["date_field"]) <= {"2023-01-05", "2023-01-06", "2023-01-07"})
+        for value in columns["datetime_field"]:
+            self.assertTrue("2023-01-05 00:00:00" <= value <= "2023-01-05 00:00:09")
+
+        date_config, datetime_config = description
+        self.assertIn(
+            generator._generate_date_data(date_config)["date_field"], 
+            {"2023-01-05", "2023-01-06", "2023-01-07"}
+            )
+        self.assertTrue(
+            "2023-01-05 00:00:00" <= generator._generate_datetime_data(datetime_config)["datetime_field"] 
+            <= "2023-01-05 00:00:09"
+            )
+
+        # A date without separators is not read as a year
+        with self.assertRaises(ValueError):
+            generator._generate_date_column(DataDescription([
+                {"name": "date_field", "data_type": "date", "allowable_values": ["20230105", "20230107"]}
+            ])[0], 10)
+
+    def test_generate_columns_logs_failed_field(self):
+        with mock.patch.object(self.generator, "_field_plan", [
+                (self.fields_by_type["integer"], None, mock.Mock(side_effect=ValueError("bad field")))
+                ]):
+            with self.assertLogs("data_generator.data_generator", level="ERROR") as logs:
+                columns = self.generator.generate_columns(5)
+        self.assertEqual(list(columns), ["generated_at"])
+        self.assertIn("integer_field", logs.output[0])
+        self.assertIn("ValueError: bad field", logs.output[0])
+
+    def test_generate_reuse_records(self):
+        first = self.generator.generate(num_records=5, reuse_records=True)
+        first_values = [dict(record) for record in first]
+        second = self.generator.generate(num_records=5, reuse_records=True)
+        self.assertIs(first, second)
+        self.assertNotEqual(first_values, [dict(record) for record in second])
+
+        # A different size rebuilds the pool
+        third = self.generator.generate(num_records=3, reuse_records=True)
+        self.assertEqual(len(third), 3)
+        self.assertEqual(list(third[0]), list(first_values[0]))
+
+    def test_seed_repeats_data(self):
+        first = DataGenerator(self.data_description, self.datetime_format, seed=42)
+        second = DataGenerator(self.data_description, self.datetime_format, seed=42)
+        first_columns = first.generate_columns(50)
+        second_columns = second.generate_columns(50)
+        del first_columns["generated_at"], second_columns["generated_at"]
+        self.assertEqual(first_columns, second_columns)
+
+        for data_type, generate_fn in first.datatype_lookup.items():
+            with self.subTest(data_type=data_type):
+                field_config = self.fields_by_type[data_type]
+                self.assertEqual(
+                    generate_fn(field_config), second.datatype_lookup[data_type](field_config)
+                    )
+
     def test_stop_method(self):
         # Confirm that `stop` sets keep_on_swimming to False
         self.generator.stop()
         self.assertFalse(self.generator.keep_on_swimming)
 
     def test_generate_date_data(self):
-        field_config = next(field for field in self.generator.data_description if field.data_type == "date")
+        field_config = self.fields_by_type["date"]
         start_date = datetime.strptime(field_config.allowable_values[0], "%Y-%m-%d")
         end_date = datetime.strptime(field_config.allowable_values[1], "%Y-%m-%d")
 
@@ -55,7 +172,7 @@ class TestDataGenerator(unittest.TestCase):
                 self.assertIsNone(value)
 
     def test_generate_datetime_data(self):
-        field_config = next(field for field in self.generator.data_description if field.data_type == "datetime")
+        field_config = self.fields_by_type["datetime"]
         start_datetime = datetime.strptime(field_config.allowable_values[0], "%Y-%m-%d %H:%M:%S")
         end_datetime = datetime.strptime(field_config.allowable_values[1], "%Y-%m-%d %H:%M:%S")
 
@@ -71,7 +188,7 @@ class TestDataGenerator(unittest.TestCase):
                 self.assertIsNone(value)
 
     def test_generate_categorical_data(self):
-        field_config = next(field for field in self.generator.data_description if field.data_type == "category")
+        field_config = self.fields_by_type["category"]
         allowable_values = field_config.allowable_values
 
         for _ in range(10):
@@ -84,7 +201,7 @@ class TestDataGenerator(unittest.TestCase):
                 self.assertIsNone(value)
 
     def test_generate_integer_data(self):
-        field_config = next(field for field in self.generator.data_description if field.data_type == "integer")
+        field_config = self.fields_by_type["integer"]
         min_value, max_value = field_config.allowable_values
 
         for _ in range(10):
@@ -99,7 +216,7 @@ class TestDataGenerator(unittest.TestCase):
                 self.assertIsNone(value)
 
     def test_generate_float_data(self):
-        field_config = next(field for field in self.generator.data_description if field.data_type == "float")
+        field_config = self.fields_by_type["float"]
         min_value, max_value = field_config.allowable_values
 
         for _ in range(10):
@@ -113,8 +230,22 @@ class TestDataGenerator(unittest.TestCase):
             else:
                 self.assertIsNone(value)
 
+    def test_generate_float_data_decimal_places(self):
+        field_config = DataDescription([{
+            "name": "rounded_float",
+            "data_type": "float",
+            "allowable_values": [0.0, 100.0],
+            "decimal_places": 2
+        }])[0]
+
+        for _ in range(10):
+            value = self.generator.datatype_lookup["float"](field_config)[field_config.name]
+            self.assertEqual(value, round(value, 2))
+            self.assertGreaterEqual(value, 0.0)
+            self.assertLessEqual(value, 100.0)
+
     def test_generate_boolean_data(self):
-        field_config = next(field for field in self.generator.data_description if field.data_type == "bool")
+        field_config = self.fields_by_type["bool"]
 
         for _ in range(10):
             fn = self.generator.datatype_lookup["bool"]
@@ -158,9 +289,11 @@ class TestDataGenerator(unittest.TestCase):
     def test_half_null_values(self):
         # Test with proportion_nulls set to 0.5
         null_counts = {data_type: 0 for data_type in df.DATA_TYPES}
-        total_records = 10000
+        total_records = 2000
+        # Seeded, so the proportion is the same on every run
+        generator = DataGenerator(self.data_description, self.datetime_format, seed=0)
 
-        for data_type, generate_fn in self.generator.datatype_lookup.items():
+        for data_type, generate_fn in generator.datatype_lookup.items():
             field_config = DataDescription([{
                 "name": f"test_{data_type}",
                 "data_type": data_type,
@@ -0,0 +1,108 @@
+import unittest
+from concurrent import futures
+from unittest import mock
+import json
+import threading
+
+from google.api_core.exceptions import NotFound, ServiceUnavailable
+from google.protobuf import json_format, struct_pb2
+
+from config.config import StreamingConfig
+from stream_event_handlers.pubsub_handler import PubSubEventHandler
+
+
+TEST_STREAMING_CONFIG = {
+    "name": "test_streaming_service",
+    "connection": {
+        "service": "pubsub",
+        "project_id": "fakeout-440306",
+        "topic_id": "feakeout-receive-2",
+        "credentials_path": "GOOGLE_APPLICATION_CREDENTIALS.json"
+    },
+    "data_description": [
+        {"name": "category_field", "data_type": "category", "allowable_values": ["A", "B", "C"]}
+    ]
+}
+
+TEST_RECORD = {
+    "generated_at": "20240101 000000 000000 +0000",
+    "category_field": "A",
+    "integer_field": 7,
+    "float_field": 0.25,
+    "bool_field": True,
+    "null_field": None
+}
+
+
+def make_handler(message_format: str) -> PubSubEventHandler:
+    """Creates a handler that publishes to a mock instead of connecting to Pub/Sub."""
+    config = StreamingConfig.model_validate(TEST_STREAMING_CONFIG)
+    config.connection.message_format = message_format
+    handler = PubSubEventHandler(config)
+    handler.topic_path = "projects/fakeout-440306/topics/feakeout-receive-2"
+    handler._publish = mock.Mock(side_effect=lambda topic_path, payload: futures.Future())
+    handler.client = mock.Mock()
+    return handler
+
+
+class TestPubSubEventHandler(unittest.TestCase):
+    def published_payload(self, handler: PubSubEventHandler) -> bytes:
+        handler.publish_batch([TEST_RECORD])
+        handler._publish.assert_called_once()
+        topic_path, payload = handler._publish.call_args.args
+        self.assertEqual(topic_path, handler.topic_path)
+        return payload
+
+    def test_publish_json(self):
+        payload = self.published_payload(make_handler('json'))
+        self.assertEqual(json.loads(payload), TEST_RECORD)
+
+    def test_publish_protobuf(self):
+        payload = self.published_payload(make_handler('protobuf'))
+        message = struct_pb2.Struct()
+        message.ParseFromString(payload)
+        self.assertEqual(json_format.MessageToDict(message), TEST_RECORD)
+
+    def test_non_retryable_error_raised(self):
+        handler = make_handler('json')
+        handler.publish_batch([TEST_RECORD, TEST_RECORD])
+        with self.assertLogs("stream_event_handlers.pubsub_handler", level="ERROR") as logs:
+            for future in handler._inflight:
+                future.set_exception(NotFound("topic not found"))
+        # Only the first failure is logged
+        self.assertEqual(len(logs.output), 1)
+
+        with self.assertRaises(NotFound):
+            handler.publish_batch([TEST_RECORD])
+        with self.assertRaises(NotFound):
+            handler.close()
+
+    def test_transient_error_not_raised(self):
+        handler = make_handler('json')
+        handler.publish_batch([TEST_RECORD])
+        with self.assertLogs("stream_event_handlers.pubsub_handler", level="ERROR"):
+            handler._inflight[0].set_exception(ServiceUnavailable("try again"))
+
+        handler.publish_batch([TEST_RECORD])
+        handler._inflight[-1].set_result("message-id")
+        handler.close()
+        self.assertEqual(handler.n_confirmed, 1)
+
+    def test_publish_not_capped_below_flow_control_limit(self):
+        config = dict(TEST_STREAMING_CONFIG)
+        config["connection"] = {**config["connection"], "max_outstanding_messages": 5000}
+        handler = PubSubEventHandler(StreamingConfig.model_validate(config))
+        handler.topic_path = "projects/fakeout-440306/topics/feakeout-receive-2"
+        handler._publish = mock.Mock(side_effect=lambda topic_path, payload: futures.Future())
+
+        # None of the publishes are acknowledged, so a cap would block forever
+        publisher = threading.Thread(target=handler.publish_batch, args=([TEST_RECORD] * 1500,), daemon=True)
+        publisher.start()
+        publisher.join(timeout=5)
+        self.assertFalse(publisher.is_alive())
+        self.assertEqual(handler._publish.call_count, 1500)
+        self.assertEqual(len(handler._inflight), 1500)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+import time
+from unittest import mock
+
+from config.config import StreamingConfig
+from stream_event_handlers.base import BaseEventHandler
+from streaming_service import StreamingService
+
+
+TEST_STREAMING_CONFIG = {
+    "name": "test_streaming_service",
+    "connection": {
+        "service": "pubsub",
+        "project_id": "fakeout-440306",
+        "topic_id": "feakeout-receive-2",
+        "credentials_path": "GOOGLE_APPLICATION_CREDENTIALS.json"
+    },
+    "data_description": [
+        {"name": "category_field", "data_type": "category", "allowable_values": ["A", "B", "C"]}
+    ]
+}
+
+
+class StubEventHandler(BaseEventHandler):
+    """Records published blocks instead of sending them anywhere."""
+    # Set by a test to make the next publish_batch fail
+    error = None
+
+    def __init__(self, config) -> None:
+        super().__init__()
+        self.batches = []
+        self.n_batches_at_close = None
+
+    def connect(self):
+        pass
+
+    def publish(self, message):
+        self.publish_batch([message])
+
+    def publish_async(self, message):
+        raise NotImplementedError
+
+    def publish_batch(self, messages):
+        if self.error is not None:
+            raise self.error
+        # Slow enough that close() would overtake the queue if it didn't wait
+        time.sleep(0.01)
+        self.batches.append(messages)
+
+    def close(self):
+        self.n_batches_at_close = len(self.batches)
+
+
+class TestStreamingService(unittest.TestCase):
+    def setUp(self):
+        config = StreamingConfig.model_validate(TEST_STREAMING_CONFIG)
+        with mock.patch.object(StreamingService, "_load_event_handler", return_value=StubEventHandler):
+            self.service = StreamingService(config)
+        self.handler = self.service.event_handler
+
+    def tearDown(self):
+        self.service.publish_queue.put(None)
+
+    def test_push_publishes_blocks(self):
+        blocks = [self.service.generate() for _ in range(3)]
+        for block in blocks:
+            self.service.push(block)
+        self.service.publish_queue.join()
+        self.assertEqual(self.handler.batches, blocks)
+
+    def test_publish_error_raised_by_push(self):
+        self.handler.error = RuntimeError("publish failed")
+        with self.assertLogs("streaming_service", level="ERROR"):
+            self.service.push(self.service.generate())
+            self.service.publish_queue.join()
+
+        with self.assertRaises(RuntimeError):
+            self.service.push(self.service.generate())
+        self.assertEqual(self.handler.batches, [])
+
+    def test_close_flushes_queue_before_closing_handler(self):
+        for _ in range(5):
+            self.service.push(self.service.generate())
+        self.service.close()
+        self.assertEqual(self.handler.n_batches_at_close, 5)
+        self.assertFalse(self.service._publishing_thread.is_alive())
+
+
+if __name__ == "__main__":
+    unittest.main()
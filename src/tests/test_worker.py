@@ -0,0 +1,65 @@
+import unittest
+from unittest import mock
+
+from worker import Worker, _wait_until
+
+
+class TestWaitUntil(unittest.TestCase):
+    def setUp(self):
+        self.stop_event = mock.Mock()
+
+    @mock.patch("worker.time.monotonic", return_value=100.0)
+    def test_waits_for_future_deadline(self, _):
+        self.assertEqual(_wait_until(102.5, self.stop_event), 102.5)
+        self.stop_event.wait.assert_called_once_with(2.5)
+
+    @mock.patch("worker.time.monotonic", return_value=100.0)
+    def test_skips_missed_deadline(self, _):
+        # The schedule restarts from now rather than catching up
+        self.assertEqual(_wait_until(97.0, self.stop_event), 100.0)
+        self.stop_event.wait.assert_not_called()
+
+
+class TestRunServices(unittest.TestCase):
+    def setUp(self):
+        # Stops after two passes of the loop
+        self.stop_event = mock.Mock()
+        self.stop_event.is_set.side_effect = [False, False, True, True]
+
+    @mock.patch("worker.time.monotonic", side_effect=[0.0, 1.0, 12.0])
+    @mock.patch("worker.StreamingService")
+    def test_run_streaming_service(self, streaming_service, _):
+        service = streaming_service.return_value
+        service.interval = 5
+        Worker._run_streaming_service(mock.sentinel.config, self.stop_event)
+
+        streaming_service.assert_called_once_with(mock.sentinel.config)
+        self.assertEqual(service.push.call_count, 2)
+        # Waits 4s until the first deadline, then the second has already passed
+        self.stop_event.wait.assert_called_once_with(4.0)
+        service.close.assert_called_once()
+
+    @mock.patch("worker.time.monotonic", side_effect=[0.0, 1.0])
+    @mock.patch("worker.BatchService")
+    def test_run_batch_service(self, batch_service, _):
+        service = batch_service.return_value
+        service.interval = 5
+        with mock.patch("builtins.print"):
+            Worker._run_batch_service(mock.sentinel.config, self.stop_event)
+
+        batch_service.assert_called_once_with(mock.sentinel.config)
+        self.assertEqual(service.export_batch.call_count, 1)
+        self.stop_event.wait.assert_called_once_with(4.0)
+        service.clean_old_exports.assert_called()
+
+    @mock.patch("worker.StreamingService")
+    def test_streaming_service_closed_on_error(self, streaming_service):
+        service = streaming_service.return_value
+        service.push.side_effect = RuntimeError("publish failed")
+        with self.assertRaises(RuntimeError):
+            Worker._run_streaming_service(mock.sentinel.config, self.stop_event)
+        service.close.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
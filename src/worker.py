@@ -1,114 +1,170 @@
+import signal
 import time
-from threading import Thread
-from typing import Any, List
+import multiprocessing
+from concurrent.futures import FIRST_EXCEPTION, ProcessPoolExecutor, wait
+from typing import Any, Callable, Optional
 
 from streaming_service import StreamingService
 from batch_service import BatchService
 
+# Set in each service process by _init_service_process
+_stop_event: Optional[Any] = None
+
+
+def _init_service_process(stop_event: Any) -> None:
+    """
+    Prepares a freshly started service process.
+
+    The stop event can only be shared with a process when it is created, so it
+    is passed here rather than with each submitted service. Interrupts are
+    ignored, as the main process owns shutdown and signals it through the event.
+
+    Args:
+        stop_event (multiprocessing.Event): Set by the main process to stop the services.
+    """
+    global _stop_event
+    _stop_event = stop_event
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+
+
+def _run_in_service_process(run_service: Callable[[Any, Any], None], service_config: Any) -> None:
+    """Runs a service in a pool process, with the stop event it was started with."""
+    run_service(service_config, _stop_event)
+
+
+def _wait_until(deadline: float, stop_event: Any) -> float:
+    """
+    Waits until `deadline` on the monotonic clock, returning early if the 
+    services are stopped. A deadline that has already passed is moved to now, 
+    so intervals missed by slow work are skipped rather than caught up on.
+
+    Args:
+        deadline (float): Time to wait until, from time.monotonic().
+        stop_event (multiprocessing.Event): Set to stop the services.
+
+    Returns:
+        float: The deadline that was waited for, to schedule the next one from.
+    """
+    now = time.monotonic()
+    if deadline <= now:
+        return now
+    stop_event.wait(deadline - now)
+    return deadline
+
+
 class Worker:
     """
-    Coordinates data generation, streaming, and batching processes using multiple threads.
-    
+    Coordinates data generation, streaming, and batching, running each service
+    in its own process.
+
+    Data generation is CPU bound, so services running as threads would all
+    share one interpreter lock. Each service process builds its own service
+    from its config, as connections and publishing threads can't be shared
+    between processes.
+
     Attributes:
-        data_generator: Object responsible for generating data records.
-        streaming_service: Service used to stream generated data.
-        batch_service: Service used to batch and save data periodically.
-        keep_running (bool): Controls whether the worker should continue running.
-        data_queue (queue.Queue): Queue to manage data between streaming and batching threads.
+        streaming_configs (list): Configs of the streaming services to run.
+        batch_configs (list): Configs of the batch services to run.
     """
+
     def __init__(
-            self, 
+            self,
             config
             ) -> None:
         """
-        Initializes the Worker with data generation, streaming, and batch services.
-        
+        Initializes the Worker with the streaming and batch service configs.
+
         Args:
-            data_generator: Data generator instance for producing data records.
-            streaming_service: Streaming service instance for sending data to a stream.
-            batch_service: Batch service instance for saving data in batches.
+            config (Config): Config holding the streaming and batch service configs.
         """
-        self.streaming_services = []
-        self.batch_services = []
-        self.keep_running = True
+        self.streaming_configs = config.streaming_configs
+        self.batch_configs = config.batch_configs
+        self._stop_event = multiprocessing.Event()
 
-        for streaming_service in config.streaming_configs:
-            self.streaming_services.append(StreamingService(streaming_service))
 
-        for batch_service in config.batch_configs:
-            self.batch_services.append(BatchService(batch_service))
-        
-# TODO: Need to fix the threading for multiple streaming and batch services
     def start(self) -> None:
         """
-        Starts the worker by launching the streaming and batching threads.
-        
-        This method creates separate threads for each streaming and batching operation.
-        """
-
-        # Create and start a thread for each streaming service
-        self.streaming_threads = [
-            Thread(target=self._run_streaming_service, args=(service,))
-            for service in self.streaming_services
-        ]
-
-        # Start threads for each batch service
-        self.batch_threads = [
-            Thread(target=self._run_batch_service, args=(service,))
-            for service in self.batch_services
-        ]
-
-        self.all_threads = self.streaming_threads + self.batch_threads
+        Starts the worker by launching a process for each streaming and batch service.
 
-
-        # Launch all threads
-        for thread in self.all_threads:
-            thread.start()
-        
-        # Wait for all threads to complete
-        for thread in self.all_threads:
-            thread.join()
+        Blocks until the services stop. If a service fails, the others are
+        stopped and its exception is raised here.
+        """
+        n_services = len(self.streaming_configs) + len(self.batch_configs)
+        if n_services == 0:
+            return
+
+        # Every service runs until stopped, so each needs a process of its own
+        with ProcessPoolExecutor(
+                max_workers=n_services,
+                initializer=_init_service_process,
+                initargs=(self._stop_event,)
+                ) as pool:
+            futures = [
+                pool.submit(_run_in_service_process, self._run_streaming_service, service_config)
+                for service_config in self.streaming_configs
+            ] + [
+                pool.submit(_run_in_service_process, self._run_batch_service, service_config)
+                for service_config in self.batch_configs
+            ]
+            try:
+                done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+            finally:
+                self._stop_event.set()
+
+        for future in done:
+            future.result()
 
     def stop(self) -> None:
         """
-        Signals the worker to stop running by setting keep_running to False.
+        Signals the services to stop. Each service process cleans up after
+        itself once it sees the signal.
         """
-        self.keep_running = False
-        for batch_service in self.batch_services:
-            batch_service.clean_old_exports()
-        # PubSub doesn't have a close connection capability, but others might. 
-        #  Leaving this breadcrumb here.
-        # for streaming_service in self.streaming_services:
-        #     streaming_service.close()
+        self._stop_event.set()
 
 
-    def _run_streaming_service(self, service: StreamingService) -> None:
+    @staticmethod
+    def _run_streaming_service(service_config: Any, stop_event: Any) -> None:
         """
-        Manages the lifecycle of a single streaming service, handling data generation and streaming.
-        
+        Manages the lifecycle of a single streaming service, handling data generation.
+        Generated blocks are queued for the service's publishing thread.
+
         Args:
-            service (StreamingService): The streaming service to run.
+            service_config (StreamingConfig): Config of the streaming service to run.
+            stop_event (multiprocessing.Event): Set to stop the service.
         """
-        while self.keep_running:
-            data = service.data_generator.generate(num_records=service.block_size)
-            service.push(data)
-            time.sleep(service.interval)
-
-
-    def _run_batch_service(self, service: BatchService) -> None:
+        service = StreamingService(service_config)
+        # Blocks start every interval, however long each one takes to generate
+        next_tick = time.monotonic()
+        try:
+            while not stop_event.is_set():
+                service.push(service.generate())
+                next_tick = _wait_until(next_tick + service.interval, stop_event)
+        finally:
+            service.close()
+
+
+    @staticmethod
+    def _run_batch_service(service_config: Any, stop_event: Any) -> None:
         """
         Manages the lifecycle of a single batch service, handling data generation and batching.
-        
+
         Args:
-            service (BatchService): The batch service to run.
+            service_config (BatchConfig): Config of the batch service to run.
+            stop_event (multiprocessing.Event): Set to stop the service.
         """
+        service = BatchService(service_config)
         service.clean_old_exports()
-        while self.keep_running:
-            time.sleep(service.interval)
-            # Generate batch data, export it, and clean up
-            batch_data = service.data_generator.generate(num_records=service.block_size)
-            service.export_batch(batch_data)
-            print(f"Batch data exported for service: {service.service_name}")
+        next_tick = time.monotonic()
+        try:
+            while not stop_event.is_set():
+                next_tick = _wait_until(next_tick + service.interval, stop_event)
+                if stop_event.is_set():
+                    break
+                # Generate batch data, export it, and clean up
+                batch_data = service.generate()
+                service.export_batch(batch_data)
+                print(f"Batch data exported for service: {service.service_name}")
+                service.clean_old_exports()
+        finally:
             service.clean_old_exports()
-
-